@@ -9,6 +9,8 @@ from datetime import date, timedelta, datetime
 from collections import defaultdict
 from typing import Optional, List, Any, Dict
 from functools import lru_cache
+from heapq import nlargest
+from urllib.parse import quote_plus, urlparse
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -16,11 +18,13 @@ sys.path.insert(0, str(project_root))
 
 from fastapi import FastAPI, Request, Query, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
+from markupsafe import escape
 import uvicorn
 
 from src.storage.factory import get_article_storage, get_knowledge_graph
 from src.config.feed_manager import FeedManager
 from src.newsletter.generator import NewsletterGenerator
+from src.enrichment.enrichment_service import EnrichmentService
 
 app = FastAPI(title="Recruiter Intelligence")
 
@@ -710,6 +714,37 @@ HTML_TEMPLATE = """
             background: #fee2e2;
             color: #b91c1c;
         }}
+        .nl-item {{
+            display: flex;
+            justify-content: space-between;
+            align-items: baseline;
+            padding: 10px 0;
+            border-bottom: 1px solid var(--gray-100);
+        }}
+        .nl-main {{ flex: 1; }}
+        .nl-link {{
+            font-weight: 500;
+            color: var(--gray-900);
+            text-decoration: none;
+        }}
+        .nl-link-muted {{
+            color: var(--gray-700);
+            text-decoration: none;
+        }}
+        .nl-detail {{ color: var(--gray-500); }}
+        .nl-amount {{ font-weight: 500; }}
+        .nl-tag {{
+            font-size: 0.7em;
+            font-weight: 500;
+            padding: 3px 8px;
+            border-radius: 3px;
+            text-transform: uppercase;
+        }}
+        .nl-tag-sec, .nl-tag-available {{ background: #e8f5e9; color: #2e7d32; }}
+        .nl-tag-news {{ background: #e3f2fd; color: #1565c0; }}
+        .nl-tag-ma {{ background: #f3e5f5; color: #7b1fa2; }}
+        .nl-tag-layoff {{ background: #ffebee; color: #c62828; }}
+        .nl-tag-hired {{ background: #fff3e0; color: #e65100; }}
     </style>
 </head>
 <body>
@@ -1623,7 +1658,6 @@ async def timeline(
                          'departure' if 'DEPARTED' in rel.predicate or 'LAID' in rel.predicate else 'hire'
 
             if rel.source_url:
-                from urllib.parse import urlparse
                 domain = urlparse(rel.source_url).netloc.replace('www.', '').split('.')[0].title()
                 source_link = f'<a href="{rel.source_url}" target="_blank" class="timeline-source">{domain}</a>'
             else:
@@ -2182,8 +2216,75 @@ async def candidates():
     return render(content, active='candidates', title_suffix='Founders & Executives')
 
 
+# Default number of rows rendered per relationship table on the entity page
+ENTITY_TABLE_ROWS = 50
+
+# Relationships loaded per table unless the full list was asked for
+ENTITY_QUERY_LIMIT = 100
+
+
+def _parse_row_limit(value: str) -> Optional[int]:
+    """Parse a table row limit query value; None means show every row."""
+    if value == 'all':
+        return None
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return ENTITY_TABLE_ROWS
+
+
+def _query_limit(value: str) -> Optional[int]:
+    """Relationships to load for a table; None (for 'all') loads every one."""
+    row_limit = _parse_row_limit(value)
+    return None if row_limit is None else max(row_limit, ENTITY_QUERY_LIMIT)
+
+
+def _show_all_link(total: int, limit: str, href: str) -> str:
+    """Render a 'Show all' link when a relationship table was truncated."""
+    row_limit = _parse_row_limit(limit)
+    if row_limit is None:
+        return ''
+    if total >= _query_limit(limit):
+        # The query hit its cap, so the real count is unknown
+        return (f'<div style="padding: 12px 16px;">Showing {min(row_limit, total)} of the first {total} '
+                f'(list truncated). <a href="{href}">Show all</a></div>')
+    if total > row_limit:
+        return f'<div style="padding: 12px 16px;"><a href="{href}">Show all {total}</a></div>'
+    return ''
+
+
+# Row templates for the entity detail relationship tables (filled via str.format_map)
+_SUBJECT_ROW = """
+                <tr>
+                    <td><span class="tag tag-{predicate}">{predicate}</span></td>
+                    <td><a href="/entity/{other_id}"><span class="tag tag-{other_type}">{other_name}</span></a></td>
+                    <td><strong style="color: var(--success);">{amount}</strong></td>
+                    <td>{date}</td>
+                    <td>{confidence}</td>
+                    <td style="font-size: 0.85em; color: var(--gray-500);">{context}</td>
+                    <td>{source_link}</td>
+                </tr>
+            """
+
+_OBJECT_ROW = """
+                <tr>
+                    <td><a href="/entity/{other_id}"><span class="tag tag-{other_type}">{other_name}</span></a></td>
+                    <td><span class="tag tag-{predicate}">{predicate}</span></td>
+                    <td><strong style="color: var(--success);">{amount}</strong></td>
+                    <td>{date}</td>
+                    <td>{confidence}</td>
+                    <td style="font-size: 0.85em; color: var(--gray-500);">{context}</td>
+                    <td>{source_link}</td>
+                </tr>
+            """
+
+
 @app.get("/entity/{entity_id}", response_class=HTMLResponse)
-async def entity_detail(entity_id: int):
+async def entity_detail(
+    entity_id: int,
+    subj_limit: str = Query(str(ENTITY_TABLE_ROWS), description="Rows in 'As Subject' table, or 'all'"),
+    obj_limit: str = Query(str(ENTITY_TABLE_ROWS), description="Rows in 'As Object' table, or 'all'")
+):
     """Entity detail page with all relationships, tags, and enrichment."""
     kg = get_kg()
 
@@ -2194,8 +2295,8 @@ async def entity_detail(entity_id: int):
         return render('<h1>Entity Not Found</h1>', title_suffix='Not Found')
 
     # Get relationships where entity is subject or object
-    subject_rels = kg.query(subject=entity.name, limit=100)
-    object_rels = kg.query(obj=entity.name, limit=100)
+    subject_rels = kg.query(subject=entity.name, limit=_query_limit(subj_limit))
+    object_rels = kg.query(obj=entity.name, limit=_query_limit(obj_limit))
 
     # Get tags and enrichment
     tags = kg.get_entity_tags(entity_id)
@@ -2209,13 +2310,14 @@ async def entity_detail(entity_id: int):
     else:
         breadcrumb = '<a href="/">Dashboard</a> &gt; <a href="/entities">Entities</a> &gt; '
 
+    name_html = escape(entity.name)
     content = f"""
     <div style="margin-bottom: 16px; font-size: 0.9em; color: var(--gray-500);">
-        {breadcrumb} {entity.name}
+        {breadcrumb} {name_html}
     </div>
     <h1>
-        <span class="tag tag-{entity.entity_type}">{entity.entity_type}</span>
-        {entity.name}
+        <span class="tag tag-{escape(entity.entity_type)}">{escape(entity.entity_type)}</span>
+        {name_html}
     </h1>
 
     <!-- Tags section -->
@@ -2225,7 +2327,7 @@ async def entity_detail(entity_id: int):
 
     if tags:
         for tag in tags:
-            content += f'<span class="tag tag-hot" style="margin-left: 8px;">{tag}</span>'
+            content += f'<span class="tag tag-hot" style="margin-left: 8px;">{escape(tag)}</span>'
     else:
         content += '<span style="color: var(--gray-500); margin-left: 8px;">No tags</span>'
 
@@ -2275,37 +2377,37 @@ async def entity_detail(entity_id: int):
             if all_data.get("employee_count"):
                 content += f'''
                 <div class="stat-card">
-                    <div class="stat-value">{all_data["employee_count"]:,}</div>
+                    <div class="stat-value">{escape(f'{all_data["employee_count"]:,}')}</div>
                     <div class="stat-label">Employees</div>
                 </div>'''
             elif all_data.get("employee_range"):
                 content += f'''
                 <div class="stat-card">
-                    <div class="stat-value">{all_data["employee_range"]}</div>
+                    <div class="stat-value">{escape(all_data["employee_range"])}</div>
                     <div class="stat-label">Employee Range</div>
                 </div>'''
             if all_data.get("total_funding"):
                 content += f'''
                 <div class="stat-card">
-                    <div class="stat-value" style="color: var(--success);">{all_data["total_funding"]}</div>
+                    <div class="stat-value" style="color: var(--success);">{escape(all_data["total_funding"])}</div>
                     <div class="stat-label">Total Funding</div>
                 </div>'''
             if all_data.get("founded_year"):
                 content += f'''
                 <div class="stat-card">
-                    <div class="stat-value">{all_data["founded_year"]}</div>
+                    <div class="stat-value">{escape(all_data["founded_year"])}</div>
                     <div class="stat-label">Founded</div>
                 </div>'''
             if all_data.get("funding_rounds"):
                 content += f'''
                 <div class="stat-card">
-                    <div class="stat-value">{all_data["funding_rounds"]}</div>
+                    <div class="stat-value">{escape(all_data["funding_rounds"])}</div>
                     <div class="stat-label">Funding Rounds</div>
                 </div>'''
             content += '</div>'
 
             # Company details card
-            content += f'<div class="card"><div class="card-header">Company Details <span style="font-size: 0.75em; color: var(--gray-500); margin-left: 8px;">Source: {enrichment_source} | {enriched_at}</span></div><table>'
+            content += f'<div class="card"><div class="card-header">Company Details <span style="font-size: 0.75em; color: var(--gray-500); margin-left: 8px;">Source: {escape(enrichment_source)} | {escape(enriched_at)}</span></div><table>'
             detail_fields = [
                 ("description", "Description"),
                 ("industry", "Industry"),
@@ -2319,18 +2421,18 @@ async def entity_detail(entity_id: int):
                 if value and value != "None" and value != 0:
                     if isinstance(value, list):
                         value = ", ".join(str(v) for v in value)
-                    content += f'<tr><td style="width: 150px; color: var(--gray-500); font-weight: 500;">{label}</td><td>{value}</td></tr>'
+                    content += f'<tr><td style="width: 150px; color: var(--gray-500); font-weight: 500;">{label}</td><td>{escape(value)}</td></tr>'
             content += '</table></div>'
 
             # Links card
             if any(all_data.get(k) for k in ["website_url", "linkedin_url", "crunchbase_url"]):
                 content += '<div class="card"><div class="card-header">Links</div><div style="padding: 16px;">'
                 if all_data.get("website_url"):
-                    content += f'<a href="{all_data["website_url"]}" target="_blank" class="btn btn-secondary" style="margin-right: 8px;">Website</a>'
+                    content += f'<a href="{escape(all_data["website_url"])}" target="_blank" class="btn btn-secondary" style="margin-right: 8px;">Website</a>'
                 if all_data.get("linkedin_url"):
-                    content += f'<a href="{all_data["linkedin_url"]}" target="_blank" class="btn btn-secondary" style="margin-right: 8px;">LinkedIn</a>'
+                    content += f'<a href="{escape(all_data["linkedin_url"])}" target="_blank" class="btn btn-secondary" style="margin-right: 8px;">LinkedIn</a>'
                 if all_data.get("crunchbase_url"):
-                    content += f'<a href="{all_data["crunchbase_url"]}" target="_blank" class="btn btn-secondary" style="margin-right: 8px;">Crunchbase</a>'
+                    content += f'<a href="{escape(all_data["crunchbase_url"])}" target="_blank" class="btn btn-secondary" style="margin-right: 8px;">Crunchbase</a>'
                 content += '</div></div>'
 
         # Person-specific enrichment display
@@ -2340,25 +2442,25 @@ async def entity_detail(entity_id: int):
             if all_data.get("current_title"):
                 content += f'''
                 <div class="stat-card">
-                    <div class="stat-value" style="font-size: 1.5em;">{all_data["current_title"]}</div>
+                    <div class="stat-value" style="font-size: 1.5em;">{escape(all_data["current_title"])}</div>
                     <div class="stat-label">Current Title</div>
                 </div>'''
             if all_data.get("current_company"):
                 content += f'''
                 <div class="stat-card">
-                    <div class="stat-value" style="font-size: 1.5em;">{all_data["current_company"]}</div>
+                    <div class="stat-value" style="font-size: 1.5em;">{escape(all_data["current_company"])}</div>
                     <div class="stat-label">Current Company</div>
                 </div>'''
             if all_data.get("executive_level"):
                 content += f'''
                 <div class="stat-card">
-                    <div class="stat-value" style="color: var(--purple);">{all_data["executive_level"]}</div>
+                    <div class="stat-value" style="color: var(--purple);">{escape(all_data["executive_level"])}</div>
                     <div class="stat-label">Level</div>
                 </div>'''
             content += '</div>'
 
             # Person details card
-            content += f'<div class="card"><div class="card-header">Professional Details <span style="font-size: 0.75em; color: var(--gray-500); margin-left: 8px;">Source: {enrichment_source} | {enriched_at}</span></div><table>'
+            content += f'<div class="card"><div class="card-header">Professional Details <span style="font-size: 0.75em; color: var(--gray-500); margin-left: 8px;">Source: {escape(enrichment_source)} | {escape(enriched_at)}</span></div><table>'
             detail_fields = [
                 ("location", "Location"),
                 ("previous_companies", "Previous Companies"),
@@ -2370,32 +2472,32 @@ async def entity_detail(entity_id: int):
                 if value and value != "None":
                     if isinstance(value, list):
                         value = ", ".join(str(v) for v in value)
-                    content += f'<tr><td style="width: 180px; color: var(--gray-500); font-weight: 500;">{label}</td><td>{value}</td></tr>'
+                    content += f'<tr><td style="width: 180px; color: var(--gray-500); font-weight: 500;">{label}</td><td>{escape(value)}</td></tr>'
             content += '</table></div>'
 
             # LinkedIn link
             if all_data.get("linkedin_url"):
                 content += f'''<div class="card"><div class="card-header">Links</div>
                 <div style="padding: 16px;">
-                    <a href="{all_data["linkedin_url"]}" target="_blank" class="btn btn-secondary">LinkedIn Profile</a>
+                    <a href="{escape(all_data["linkedin_url"])}" target="_blank" class="btn btn-secondary">LinkedIn Profile</a>
                 </div></div>'''
 
         # Fallback: show raw data for other entity types
         elif all_data:
             content += f'''
             <div class="card">
-                <div class="card-header">Enrichment Data <span style="color: var(--gray-500); font-weight: normal; font-size: 0.85em;">(source: {enrichment_source})</span></div>
+                <div class="card-header">Enrichment Data <span style="color: var(--gray-500); font-weight: normal; font-size: 0.85em;">(source: {escape(enrichment_source)})</span></div>
                 <table>
             '''
             for key, value in all_data.items():
                 if value and value != "None" and value != 0:
                     if isinstance(value, list):
                         value = ", ".join(str(v) for v in value)
-                    content += f'<tr><td style="width: 200px; color: var(--gray-500);">{key}</td><td>{value}</td></tr>'
+                    content += f'<tr><td style="width: 200px; color: var(--gray-500);">{escape(key)}</td><td>{escape(value)}</td></tr>'
             content += '</table></div>'
 
     # Quick links for external research
-    clean_name = entity.name.replace(" ", "+")
+    clean_name = quote_plus(entity.name)
     content += f"""
     <div class="card">
         <div class="card-header">External Research</div>
@@ -2414,7 +2516,6 @@ async def entity_detail(entity_id: int):
     for rel in subject_rels + object_rels:
         if rel.source_url and rel.source_url not in seen_urls:
             seen_urls.add(rel.source_url)
-            from urllib.parse import urlparse
             domain = urlparse(rel.source_url).netloc.replace('www.', '')
             source_articles.append({
                 'url': rel.source_url,
@@ -2433,10 +2534,10 @@ async def entity_detail(entity_id: int):
         for article in source_articles[:10]:
             content += f"""
                 <tr>
-                    <td>{article['domain']}</td>
-                    <td><span class="tag tag-{article['event']}">{article['event']}</span></td>
-                    <td>{article['date'] or '-'}</td>
-                    <td><a href="{article['url']}" target="_blank">View Article</a></td>
+                    <td>{escape(article['domain'])}</td>
+                    <td><span class="tag tag-{escape(article['event'])}">{escape(article['event'])}</span></td>
+                    <td>{escape(article['date'] or '-')}</td>
+                    <td><a href="{escape(article['url'])}" target="_blank">View Article</a></td>
                 </tr>
             """
         content += "</table></div>"
@@ -2456,24 +2557,24 @@ async def entity_detail(entity_id: int):
         if hasattr(d, 'isoformat'):
             return d.isoformat()
         return str(d)
-    all_events.sort(key=sort_key, reverse=True)
+    top_events = nlargest(15, all_events, key=sort_key)
 
-    if all_events:
+    if top_events:
         content += """
         <div class="card">
             <div class="card-header">Event Timeline</div>
             <div style="padding: 16px;">
         """
-        for evt in all_events[:15]:
+        for evt in top_events:
             color_map = {'ACQUIRED': 'var(--warning)', 'FUNDED_BY': 'var(--success)', 'HIRED_BY': 'var(--primary)', 'DEPARTED_FROM': 'var(--danger)'}
             color = color_map.get(evt['type'], 'var(--gray-500)')
-            link = f'<a href="{evt["url"]}" target="_blank" style="font-size: 0.8em; margin-left: 8px;">source</a>' if evt['url'] else ''
+            link = f'<a href="{escape(evt["url"])}" target="_blank" style="font-size: 0.8em; margin-left: 8px;">source</a>' if evt['url'] else ''
             content += f"""
                 <div style="display: flex; align-items: center; padding: 8px 0; border-bottom: 1px solid var(--gray-100);">
                     <span style="width: 12px; height: 12px; border-radius: 50%; background: {color}; margin-right: 12px;"></span>
-                    <span class="tag tag-{evt['type']}">{evt['type']}</span>
-                    <span style="margin-left: 8px;">{evt['other']}</span>
-                    <span style="margin-left: auto; color: var(--gray-500);">{evt['date'] or 'Unknown date'}</span>
+                    <span class="tag tag-{escape(evt['type'])}">{escape(evt['type'])}</span>
+                    <span style="margin-left: 8px;">{escape(evt['other'])}</span>
+                    <span style="margin-left: auto; color: var(--gray-500);">{escape(evt['date'] or 'Unknown date')}</span>
                     {link}
                 </div>
             """
@@ -2486,23 +2587,25 @@ async def entity_detail(entity_id: int):
             <table>
                 <tr><th>Event</th><th>Related Entity</th><th>Amount</th><th>Date</th><th>Confidence</th><th>Context</th><th>Source</th></tr>
         """
-        for rel in subject_rels:
+        for rel in subject_rels[:_parse_row_limit(subj_limit)]:
             metadata = getattr(rel, 'metadata', {}) or {}
             amount = metadata.get('amount') or metadata.get('valuation') or '-'
-            context = (rel.context[:80] + '...') if rel.context and len(rel.context) > 80 else (rel.context or '-')
-            source_link = f'<a href="{rel.source_url}" target="_blank">View</a>' if rel.source_url else '-'
-            content += f"""
-                <tr>
-                    <td><span class="tag tag-{rel.predicate}">{rel.predicate}</span></td>
-                    <td><a href="/entity/{rel.object.id}"><span class="tag tag-{rel.object.entity_type}">{rel.object.name}</span></a></td>
-                    <td><strong style="color: var(--success);">{amount}</strong></td>
-                    <td>{rel.event_date or '-'}</td>
-                    <td>{confidence_badge(rel.confidence)}</td>
-                    <td style="font-size: 0.85em; color: var(--gray-500);">{context}</td>
-                    <td>{source_link}</td>
-                </tr>
-            """
-        content += '</table></div>'
+            context = rel.context_preview
+            source_link = f'<a href="{escape(rel.source_url)}" target="_blank">View</a>' if rel.source_url else '-'
+            content += _SUBJECT_ROW.format_map({
+                'predicate': escape(rel.predicate),
+                'other_id': rel.object.id,
+                'other_type': escape(rel.object.entity_type),
+                'other_name': escape(rel.object.name),
+                'amount': escape(amount),
+                'date': escape(rel.event_date or '-'),
+                'confidence': confidence_badge(rel.confidence),
+                'context': escape(context),
+                'source_link': source_link,
+            })
+        content += '</table>'
+        content += _show_all_link(len(subject_rels), subj_limit, f"?subj_limit=all&obj_limit={escape(obj_limit)}")
+        content += '</div>'
 
     if object_rels:
         content += """
@@ -2511,25 +2614,27 @@ async def entity_detail(entity_id: int):
             <table>
                 <tr><th>Related Entity</th><th>Event</th><th>Amount</th><th>Date</th><th>Confidence</th><th>Context</th><th>Source</th></tr>
         """
-        for rel in object_rels:
+        for rel in object_rels[:_parse_row_limit(obj_limit)]:
             metadata = getattr(rel, 'metadata', {}) or {}
             amount = metadata.get('amount') or metadata.get('valuation') or '-'
-            context = (rel.context[:80] + '...') if rel.context and len(rel.context) > 80 else (rel.context or '-')
-            source_link = f'<a href="{rel.source_url}" target="_blank">View</a>' if rel.source_url else '-'
-            content += f"""
-                <tr>
-                    <td><a href="/entity/{rel.subject.id}"><span class="tag tag-{rel.subject.entity_type}">{rel.subject.name}</span></a></td>
-                    <td><span class="tag tag-{rel.predicate}">{rel.predicate}</span></td>
-                    <td><strong style="color: var(--success);">{amount}</strong></td>
-                    <td>{rel.event_date or '-'}</td>
-                    <td>{confidence_badge(rel.confidence)}</td>
-                    <td style="font-size: 0.85em; color: var(--gray-500);">{context}</td>
-                    <td>{source_link}</td>
-                </tr>
-            """
-        content += '</table></div>'
+            context = rel.context_preview
+            source_link = f'<a href="{escape(rel.source_url)}" target="_blank">View</a>' if rel.source_url else '-'
+            content += _OBJECT_ROW.format_map({
+                'predicate': escape(rel.predicate),
+                'other_id': rel.subject.id,
+                'other_type': escape(rel.subject.entity_type),
+                'other_name': escape(rel.subject.name),
+                'amount': escape(amount),
+                'date': escape(rel.event_date or '-'),
+                'confidence': confidence_badge(rel.confidence),
+                'context': escape(context),
+                'source_link': source_link,
+            })
+        content += '</table>'
+        content += _show_all_link(len(object_rels), obj_limit, f"?subj_limit={escape(subj_limit)}&obj_limit=all")
+        content += '</div>'
 
-    return render(content, title_suffix=entity.name)
+    return render(content, title_suffix=name_html)
 
 
 @app.post("/entity/{entity_id}/tag")
@@ -2544,8 +2649,6 @@ async def add_entity_tag(entity_id: int, tag: str = Form(...)):
 @app.get("/entity/{entity_id}/enrich", response_class=HTMLResponse)
 async def enrich_entity(entity_id: int):
     """Trigger enrichment for an entity."""
-    from src.enrichment.enrichment_service import EnrichmentService
-
     kg = get_kg()
     entity = kg.get_entity_by_id(entity_id)
 
@@ -2628,6 +2731,66 @@ async def entities_by_tag(tag: str):
     return render(content, title_suffix=f'Tag: {tag}')
 
 
+def _render_funding_item(item: dict) -> str:
+    """Render a funding round row."""
+    html = f'<a href="/search?q={escape(item["company"])}" class="nl-link">{escape(item["company"])}</a>'
+    if item.get('amount'):
+        html += f' <span class="nl-detail">raised</span> <span class="nl-amount">{escape(item["amount"])}</span>'
+    tag_class = "nl-tag-sec" if item.get('source') == 'SEC' else "nl-tag-news"
+    html += f'</div><span class="nl-tag {tag_class}">{escape(item.get("source", "News"))}</span>'
+    return html
+
+
+def _render_acquisition_item(item: dict) -> str:
+    """Render an M&A row."""
+    html = f'<a href="/search?q={escape(item["acquirer"])}" class="nl-link">{escape(item["acquirer"])}</a>'
+    html += ' <span class="nl-detail">acquired</span> '
+    html += f'<a href="/search?q={escape(item["target"])}" class="nl-link">{escape(item["target"])}</a>'
+    html += '</div><span class="nl-tag nl-tag-ma">M&A</span>'
+    return html
+
+
+def _render_layoff_item(item: dict) -> str:
+    """Render a layoff row."""
+    html = f'<a href="/search?q={escape(item["company"])}" class="nl-link">{escape(item["company"])}</a>'
+    if item.get('employees'):
+        html += f' <span class="nl-detail">{item["employees"]:,} employees</span>'
+    html += '</div><span class="nl-tag nl-tag-layoff">Layoff</span>'
+    return html
+
+
+def _render_move_item(item: dict) -> str:
+    """Render an executive hire/departure row."""
+    html = f'<a href="/search?q={escape(item["person"])}" class="nl-link">{escape(item["person"])}</a>'
+    action = "joined" if item["action"] == "joined" else "left"
+    html += f' <span class="nl-detail">{action}</span> '
+    html += f'<a href="/search?q={escape(item["company"])}" class="nl-link">{escape(item["company"])}</a>'
+    tag_class = "nl-tag-hired" if item.get("signal") == "Hired" else "nl-tag-available"
+    html += f'</div><span class="nl-tag {tag_class}">{escape(item.get("signal", "Move"))}</span>'
+    return html
+
+
+def _render_candidate_item(item: dict) -> str:
+    """Render an available-candidate row."""
+    html = f'<a href="/search?q={escape(item["name"])}" class="nl-link">{escape(item["name"])}</a>'
+    if item.get('title'):
+        html += f' <span class="nl-detail">({escape(item["title"])})</span>'
+    html += ' <span class="nl-detail">from</span> '
+    html += f'<a href="/search?q={escape(item["previous_company"])}" class="nl-link-muted">{escape(item["previous_company"])}</a>'
+    html += '</div><span class="nl-tag nl-tag-available">Available</span>'
+    return html
+
+
+# Newsletter item renderers keyed by the 'kind' tag set in NewsletterGenerator
+_NEWSLETTER_ITEM_RENDERERS = {
+    'funding': _render_funding_item,
+    'acquisition': _render_acquisition_item,
+    'layoff': _render_layoff_item,
+    'move': _render_move_item,
+    'candidate': _render_candidate_item,
+}
+
+
 @app.get("/newsletter", response_class=HTMLResponse)
 async def newsletter(
     period: str = Query("weekly", description="weekly or daily"),
@@ -2637,10 +2800,13 @@ async def newsletter(
     kg = get_kg()
     generator = NewsletterGenerator(kg)
 
+    # Newsletter data only changes when the pipeline runs, so serve it from the cache
+    # (period is normalized so arbitrary query values can't grow the cache)
+    period = "daily" if period == "daily" else "weekly"
     if period == "daily":
-        nl = generator.generate_daily()
+        nl = get_cached("newsletter_daily", generator.generate_daily)
     else:
-        nl = generator.generate_weekly()
+        nl = get_cached("newsletter_weekly", generator.generate_weekly)
 
     # Format options dropdown
     format_options = f"""
@@ -2656,11 +2822,11 @@ async def newsletter(
 
     # If standalone HTML requested, return raw HTML
     if format == "standalone":
-        return HTMLResponse(generator.to_html(nl))
+        return HTMLResponse(get_cached(f"newsletter_{period}_standalone", lambda: generator.to_html(nl)))
 
     # If markdown requested, show in code block
     if format == "markdown":
-        md_content = generator.to_markdown(nl)
+        md_content = get_cached(f"newsletter_{period}_markdown", lambda: generator.to_markdown(nl))
         content = f"""
         <h1>Newsletter - {period.title()} Digest</h1>
 
@@ -2711,46 +2877,10 @@ async def newsletter(
         """
 
         for item in section.items[:12]:
-            sections_html += '<div style="display: flex; justify-content: space-between; align-items: baseline; padding: 10px 0; border-bottom: 1px solid var(--gray-100);">'
-            sections_html += '<div style="flex: 1;">'
-
-            if 'company' in item and 'amount' in item:
-                sections_html += f'<a href="/search?q={item["company"]}" style="font-weight: 500; color: var(--gray-900); text-decoration: none;">{item["company"]}</a>'
-                if item.get('amount'):
-                    sections_html += f' <span style="color: var(--gray-500);">raised</span> <span style="font-weight: 500;">{item["amount"]}</span>'
-                tag_style = "background: #e8f5e9; color: #2e7d32;" if item.get('source') == 'SEC' else "background: #e3f2fd; color: #1565c0;"
-                sections_html += f'</div><span style="font-size: 0.7em; font-weight: 500; padding: 3px 8px; border-radius: 3px; text-transform: uppercase; {tag_style}">{item.get("source", "News")}</span>'
-
-            elif 'acquirer' in item:
-                sections_html += f'<a href="/search?q={item["acquirer"]}" style="font-weight: 500; color: var(--gray-900); text-decoration: none;">{item["acquirer"]}</a>'
-                sections_html += f' <span style="color: var(--gray-500);">acquired</span> '
-                sections_html += f'<a href="/search?q={item["target"]}" style="font-weight: 500; color: var(--gray-900); text-decoration: none;">{item["target"]}</a>'
-                sections_html += '</div><span style="font-size: 0.7em; font-weight: 500; padding: 3px 8px; border-radius: 3px; text-transform: uppercase; background: #f3e5f5; color: #7b1fa2;">M&A</span>'
-
-            elif 'employees' in item:
-                sections_html += f'<a href="/search?q={item["company"]}" style="font-weight: 500; color: var(--gray-900); text-decoration: none;">{item["company"]}</a>'
-                if item.get('employees'):
-                    sections_html += f' <span style="color: var(--gray-500);">{item["employees"]:,} employees</span>'
-                sections_html += '</div><span style="font-size: 0.7em; font-weight: 500; padding: 3px 8px; border-radius: 3px; text-transform: uppercase; background: #ffebee; color: #c62828;">Layoff</span>'
-
-            elif 'person' in item and 'action' in item:
-                sections_html += f'<a href="/search?q={item["person"]}" style="font-weight: 500; color: var(--gray-900); text-decoration: none;">{item["person"]}</a>'
-                action = "joined" if item["action"] == "joined" else "left"
-                sections_html += f' <span style="color: var(--gray-500);">{action}</span> '
-                sections_html += f'<a href="/search?q={item["company"]}" style="font-weight: 500; color: var(--gray-900); text-decoration: none;">{item["company"]}</a>'
-                tag_style = "background: #fff3e0; color: #e65100;" if item.get("signal") == "Hired" else "background: #e8f5e9; color: #2e7d32;"
-                sections_html += f'</div><span style="font-size: 0.7em; font-weight: 500; padding: 3px 8px; border-radius: 3px; text-transform: uppercase; {tag_style}">{item.get("signal", "Move")}</span>'
-
-            elif 'name' in item and 'previous_company' in item:
-                sections_html += f'<a href="/search?q={item["name"]}" style="font-weight: 500; color: var(--gray-900); text-decoration: none;">{item["name"]}</a>'
-                if item.get('title'):
-                    sections_html += f' <span style="color: var(--gray-500);">({item["title"]})</span>'
-                sections_html += f' <span style="color: var(--gray-500);">from</span> '
-                sections_html += f'<a href="/search?q={item["previous_company"]}" style="color: var(--gray-700); text-decoration: none;">{item["previous_company"]}</a>'
-                sections_html += '</div><span style="font-size: 0.7em; font-weight: 500; padding: 3px 8px; border-radius: 3px; text-transform: uppercase; background: #e8f5e9; color: #2e7d32;">Available</span>'
+            sections_html += '<div class="nl-item"><div class="nl-main">'
 
-            else:
-                sections_html += '</div>'
+            renderer = _NEWSLETTER_ITEM_RENDERERS.get(item.get('kind'))
+            sections_html += renderer(item) if renderer else '</div>'
 
             sections_html += '</div>'
 
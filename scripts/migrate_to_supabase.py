@@ -8,9 +8,12 @@ Get connection string from:
     Supabase Dashboard → Settings → Database → Connection string (URI)
 """
 
+import io
 import os
 import sys
 import sqlite3
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
@@ -22,22 +25,42 @@ from dotenv import load_dotenv
 load_dotenv()
 
 try:
-    import psycopg2
     from psycopg2.extras import execute_values
+    from psycopg2.pool import ThreadedConnectionPool
 except ImportError:
     print("Installing psycopg2-binary...")
     os.system("pip install psycopg2-binary")
-    import psycopg2
     from psycopg2.extras import execute_values
+    from psycopg2.pool import ThreadedConnectionPool
+
+
+# Rows pulled from SQLite per fetchmany() call while migrating
+SQLITE_FETCH_SIZE = 1000
 
 
 def get_sqlite_conn(db_path: str):
-    """Get SQLite connection with row factory."""
+    """Get a read-only SQLite connection tuned for full-table scans."""
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    # The migration only reads the source DBs: use a 256 MB page cache and
+    # memory-map the file so sequential scans avoid read() syscalls.
+    conn.execute("PRAGMA query_only = 1")
+    conn.execute("PRAGMA cache_size = -262144")
+    conn.execute("PRAGMA mmap_size = 30000000000")
+    conn.execute("PRAGMA temp_store = MEMORY")
     return conn
 
 
+def _stream_rows(cursor, batch_size: int = SQLITE_FETCH_SIZE):
+    """Yield rows from a SQLite cursor in fetchmany batches instead of fetchall."""
+    cursor.arraysize = batch_size
+    while True:
+        rows = cursor.fetchmany()
+        if not rows:
+            break
+        yield from rows
+
+
 def migrate_feeds(sqlite_conn, pg_cursor):
     """Migrate feed configuration."""
     print("\n📡 Migrating feeds...")
@@ -54,36 +77,71 @@ def migrate_feeds(sqlite_conn, pg_cursor):
         SELECT feed_name, total_articles, last_fetch_at, last_error
         FROM feed_stats
     """)
-    feeds = cursor.fetchall()
 
-    count = 0
-    for feed in feeds:
-        try:
-            # Skip if feed already exists from schema seed data
-            pg_cursor.execute("""
-                INSERT INTO feeds (name, url, feed_type, total_articles, last_fetch_at, last_error)
-                VALUES (%s, %s, 'rss', %s, %s, %s)
-                ON CONFLICT (name) DO UPDATE SET
-                    total_articles = EXCLUDED.total_articles,
-                    last_fetch_at = EXCLUDED.last_fetch_at,
-                    last_error = EXCLUDED.last_error
-            """, (
-                feed['feed_name'],
-                f"https://example.com/feed/{feed['feed_name']}",  # Placeholder URL
-                feed['total_articles'],
-                feed['last_fetch_at'],
-                feed['last_error']
-            ))
-            count += 1
-        except Exception as e:
-            print(f"   Warning: Failed to migrate feed {feed['feed_name']}: {e}")
-
-    print(f"   ✓ Migrated {count} feeds")
-    return count
+    # Name is passed twice: once for the name column and once for the
+    # placeholder URL, which PostgreSQL builds in the VALUES template
+    rows = [
+        (feed['feed_name'], feed['feed_name'], feed['total_articles'],
+         feed['last_fetch_at'], feed['last_error'])
+        for feed in _stream_rows(cursor)
+    ]
+
+    if rows:
+        # Update existing rows (e.g. schema seed data) instead of duplicating
+        execute_values(pg_cursor, """
+            INSERT INTO feeds (name, url, feed_type, total_articles, last_fetch_at, last_error)
+            VALUES %s
+            ON CONFLICT (name) DO UPDATE SET
+                total_articles = EXCLUDED.total_articles,
+                last_fetch_at = EXCLUDED.last_fetch_at,
+                last_error = EXCLUDED.last_error
+        """, rows, template="(%s, 'https://example.com/feed/' || %s, 'rss', %s, %s, %s)", page_size=len(rows))
+
+    print(f"   ✓ Migrated {len(rows)} feeds")
+    return len(rows)
+
+
+ARTICLE_COLUMNS = (
+    "url, title, content, summary, content_hash, published_at, fetched_at, "
+    "classification_status, extraction_status, event_type, is_high_signal"
+)
+
+# Status values indexed by SQLite's 0/1 processed/extracted flags
+CLASSIFICATION_STATUS = ('pending', 'classified')
+EXTRACTION_STATUS = ('pending', 'extracted')
+
+
+def _copy_value(value) -> str:
+    """Encode a value as a field of PostgreSQL's COPY text format."""
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    return (str(value)
+            .replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r'))
+
+
+def _copy_rows(pg_cursor, table: str, columns: str, rows) -> None:
+    """Bulk-load rows into a table with COPY FROM STDIN."""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write('\t'.join(_copy_value(v) for v in row))
+        buf.write('\n')
+    buf.seek(0)
+    pg_cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT text)", buf)
 
 
 def migrate_articles(sqlite_conn, pg_cursor):
-    """Migrate articles from raw_articles table."""
+    """Migrate articles from raw_articles table.
+
+    Rows are COPYed into a temporary staging table and merged into
+    articles with a single INSERT ... ON CONFLICT at the end.
+    """
     print("\n📰 Migrating articles...")
 
     cursor = sqlite_conn.execute("""
@@ -93,16 +151,16 @@ def migrate_articles(sqlite_conn, pg_cursor):
         FROM raw_articles
         ORDER BY fetched_at ASC
     """)
-    articles = cursor.fetchall()
+
+    pg_cursor.execute("""
+        CREATE TEMP TABLE articles_stage (LIKE articles INCLUDING DEFAULTS)
+    """)
 
     count = 0
-    batch_size = 500
+    batch_size = 50000
     batch = []
 
-    for article in articles:
-        classification_status = 'classified' if article['processed'] else 'pending'
-        extraction_status = 'extracted' if article['extracted'] else 'pending'
-
+    for article in _stream_rows(cursor):
         batch.append((
             article['url'],
             article['title'],
@@ -111,37 +169,33 @@ def migrate_articles(sqlite_conn, pg_cursor):
             article['content_hash'],
             article['published_at'],
             article['fetched_at'],
-            classification_status,
-            extraction_status,
+            CLASSIFICATION_STATUS[bool(article['processed'])],
+            EXTRACTION_STATUS[bool(article['extracted'])],
             article['event_type'],
-            bool(article['is_high_signal'])
+            article['is_high_signal'] or 0  # COPY accepts 0/1 for booleans
         ))
 
         if len(batch) >= batch_size:
-            _insert_articles_batch(pg_cursor, batch)
+            _copy_rows(pg_cursor, "articles_stage", ARTICLE_COLUMNS, batch)
             count += len(batch)
-            print(f"   Migrated {count} articles...")
+            print(f"   Staged {count} articles...")
             batch = []
 
     if batch:
-        _insert_articles_batch(pg_cursor, batch)
+        _copy_rows(pg_cursor, "articles_stage", ARTICLE_COLUMNS, batch)
         count += len(batch)
 
+    pg_cursor.execute(f"""
+        INSERT INTO articles ({ARTICLE_COLUMNS})
+        SELECT {ARTICLE_COLUMNS} FROM articles_stage
+        ON CONFLICT (url) DO NOTHING
+    """)
+    pg_cursor.execute("DROP TABLE articles_stage")
+
     print(f"   ✓ Migrated {count} articles")
     return count
 
 
-def _insert_articles_batch(pg_cursor, batch):
-    """Insert a batch of articles."""
-    execute_values(pg_cursor, """
-        INSERT INTO articles (url, title, content, summary, content_hash,
-                             published_at, fetched_at, classification_status,
-                             extraction_status, event_type, is_high_signal)
-        VALUES %s
-        ON CONFLICT (url) DO NOTHING
-    """, batch)
-
-
 def migrate_entities(sqlite_conn, pg_cursor):
     """Migrate entities from kg_entities table."""
     print("\n🏢 Migrating entities...")
@@ -150,40 +204,62 @@ def migrate_entities(sqlite_conn, pg_cursor):
         SELECT id, name, normalized_name, entity_type, attributes_json, first_seen, last_seen, mention_count
         FROM kg_entities
     """)
-    entities = cursor.fetchall()
 
-    # Build ID mapping (SQLite integer ID -> PostgreSQL UUID)
+    # Build ID mapping (SQLite integer ID -> PostgreSQL UUID).
+    # UUIDs are generated client-side so a whole batch can be inserted in one
+    # round trip without relying on RETURNING row order.
     id_mapping = {}
     count = 0
+    batch_size = 1000
+    batch = []
 
-    for entity in entities:
-        try:
-            pg_cursor.execute("""
-                INSERT INTO entities (name, normalized_name, entity_type, attributes,
-                                     first_seen_at, last_seen_at, mention_count)
-                VALUES (%s, %s, %s, %s::jsonb, %s, %s, %s)
-                RETURNING id
-            """, (
-                entity['name'],
-                entity['normalized_name'],
-                entity['entity_type'],
-                entity['attributes_json'] or '{}',
-                entity['first_seen'],
-                entity['last_seen'],
-                entity['mention_count'] or 1
-            ))
-            new_id = pg_cursor.fetchone()[0]
-            id_mapping[entity['id']] = new_id
-            count += 1
-        except Exception as e:
-            print(f"   Warning: Failed to migrate entity {entity['name']}: {e}")
+    for entity in _stream_rows(cursor):
+        new_id = str(uuid.uuid4())
+        id_mapping[entity['id']] = new_id
+        batch.append((
+            new_id,
+            entity['name'],
+            entity['normalized_name'],
+            entity['entity_type'],
+            entity['attributes_json'] or '{}',
+            entity['first_seen'],
+            entity['last_seen'],
+            entity['mention_count'] or 1
+        ))
+
+        if len(batch) >= batch_size:
+            _insert_entities_batch(pg_cursor, batch)
+            count += len(batch)
+            batch = []
+
+    if batch:
+        _insert_entities_batch(pg_cursor, batch)
+        count += len(batch)
 
     print(f"   ✓ Migrated {count} entities")
     return id_mapping
 
 
+def _insert_entities_batch(pg_cursor, batch):
+    """Insert a batch of entities with pre-assigned UUIDs."""
+    execute_values(pg_cursor, """
+        INSERT INTO entities (id, name, normalized_name, entity_type, attributes,
+                             first_seen_at, last_seen_at, mention_count)
+        VALUES %s
+    """, batch, template="(%s::uuid, %s, %s, %s, %s::jsonb, %s, %s, %s)", page_size=len(batch))
+
+
+RELATIONSHIP_COLUMNS = (
+    "subject_id, predicate, object_id, context, source_url, confidence, created_at"
+)
+
+
 def migrate_relationships(sqlite_conn, pg_cursor, entity_id_mapping):
-    """Migrate relationships from kg_relationships table."""
+    """Migrate relationships from kg_relationships table.
+
+    Like articles, rows are COPYed into a temporary staging table and
+    merged into relationships with a single INSERT ... ON CONFLICT.
+    """
     print("\n🔗 Migrating relationships...")
 
     cursor = sqlite_conn.execute("""
@@ -191,12 +267,17 @@ def migrate_relationships(sqlite_conn, pg_cursor, entity_id_mapping):
                confidence, created_at
         FROM kg_relationships
     """)
-    relationships = cursor.fetchall()
+
+    pg_cursor.execute("""
+        CREATE TEMP TABLE relationships_stage (LIKE relationships INCLUDING DEFAULTS)
+    """)
 
     count = 0
     skipped = 0
+    batch_size = 50000
+    batch = []
 
-    for rel in relationships:
+    for rel in _stream_rows(cursor):
         subject_uuid = entity_id_mapping.get(rel['subject_id'])
         object_uuid = entity_id_mapping.get(rel['object_id'])
 
@@ -204,25 +285,31 @@ def migrate_relationships(sqlite_conn, pg_cursor, entity_id_mapping):
             skipped += 1
             continue
 
-        try:
-            pg_cursor.execute("""
-                INSERT INTO relationships (subject_id, predicate, object_id,
-                                          context, source_url, confidence, created_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT DO NOTHING
-            """, (
-                subject_uuid,
-                rel['predicate'],
-                object_uuid,
-                rel['context'],
-                rel['source_url'],
-                rel['confidence'] or 0.8,
-                rel['created_at']
-            ))
-            count += 1
-        except Exception as e:
-            print(f"   Warning: Failed to migrate relationship: {e}")
-            skipped += 1
+        batch.append((
+            subject_uuid,
+            rel['predicate'],
+            object_uuid,
+            rel['context'],
+            rel['source_url'],
+            rel['confidence'] or 0.8,
+            rel['created_at']
+        ))
+
+        if len(batch) >= batch_size:
+            _copy_rows(pg_cursor, "relationships_stage", RELATIONSHIP_COLUMNS, batch)
+            count += len(batch)
+            batch = []
+
+    if batch:
+        _copy_rows(pg_cursor, "relationships_stage", RELATIONSHIP_COLUMNS, batch)
+        count += len(batch)
+
+    pg_cursor.execute(f"""
+        INSERT INTO relationships ({RELATIONSHIP_COLUMNS})
+        SELECT {RELATIONSHIP_COLUMNS} FROM relationships_stage
+        ON CONFLICT DO NOTHING
+    """)
+    pg_cursor.execute("DROP TABLE relationships_stage")
 
     print(f"   ✓ Migrated {count} relationships (skipped {skipped})")
     return count
@@ -244,34 +331,144 @@ def migrate_enrichment(sqlite_conn, pg_cursor, entity_id_mapping):
         SELECT entity_id, source, data_json, enriched_at
         FROM kg_enrichment
     """)
-    enrichments = cursor.fetchall()
+    # Targets created from an older schema.sql lack this column
+    pg_cursor.execute("ALTER TABLE entities ADD COLUMN IF NOT EXISTS enrichment_source VARCHAR(50)")
 
     count = 0
-    for enrichment in enrichments:
+    batch_size = 1000
+    # Keyed by entity UUID so a later record for the same entity wins,
+    # matching the old row-by-row UPDATE order
+    batch = {}
+
+    for enrichment in _stream_rows(cursor):
         entity_uuid = entity_id_mapping.get(enrichment['entity_id'])
         if not entity_uuid:
             continue
 
-        try:
-            pg_cursor.execute("""
-                UPDATE entities
-                SET enrichment_data = %s::jsonb,
-                    enrichment_status = 'enriched',
-                    enriched_at = %s
-                WHERE id = %s
-            """, (
-                enrichment['data_json'] or '{}',
-                enrichment['enriched_at'],
-                entity_uuid
-            ))
-            count += 1
-        except Exception as e:
-            print(f"   Warning: Failed to migrate enrichment: {e}")
+        batch[entity_uuid] = (
+            entity_uuid,
+            enrichment['data_json'] or '{}',
+            enrichment['source'],
+            enrichment['enriched_at']
+        )
+        count += 1
+
+        if len(batch) >= batch_size:
+            _update_enrichment_batch(pg_cursor, list(batch.values()))
+            batch = {}
+
+    if batch:
+        _update_enrichment_batch(pg_cursor, list(batch.values()))
 
     print(f"   ✓ Migrated {count} enrichment records")
     return count
 
 
+def _update_enrichment_batch(pg_cursor, batch):
+    """Apply a batch of enrichment updates with a single UPDATE ... FROM (VALUES)."""
+    execute_values(pg_cursor, """
+        UPDATE entities
+        SET enrichment_data = v.data,
+            enrichment_source = v.source,
+            enrichment_status = 'enriched',
+            enriched_at = v.ts
+        FROM (VALUES %s) AS v(id, data, source, ts)
+        WHERE entities.id = v.id
+    """, batch, template="(%s::uuid, %s::jsonb, %s, %s::timestamptz)", page_size=len(batch))
+
+
+# Secondary indexes and foreign keys (from schema.sql) that are dropped during
+# the bulk load and rebuilt afterwards. Unique constraints stay in place since
+# the ON CONFLICT clauses depend on them.
+BULK_LOAD_INDEXES = [
+    ("DROP INDEX IF EXISTS idx_articles_status",
+     "CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(classification_status, extraction_status)"),
+    ("DROP INDEX IF EXISTS idx_articles_high_signal",
+     "CREATE INDEX IF NOT EXISTS idx_articles_high_signal ON articles(is_high_signal) WHERE is_high_signal = true"),
+    ("DROP INDEX IF EXISTS idx_articles_published",
+     "CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at DESC)"),
+    ("DROP INDEX IF EXISTS idx_articles_event_type",
+     "CREATE INDEX IF NOT EXISTS idx_articles_event_type ON articles(event_type)"),
+    ("DROP INDEX IF EXISTS idx_entities_normalized",
+     "CREATE INDEX IF NOT EXISTS idx_entities_normalized ON entities(normalized_name)"),
+    ("DROP INDEX IF EXISTS idx_entities_type",
+     "CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(entity_type)"),
+    ("DROP INDEX IF EXISTS idx_entities_canonical",
+     "CREATE INDEX IF NOT EXISTS idx_entities_canonical ON entities(canonical_id) WHERE canonical_id IS NOT NULL"),
+    ("DROP INDEX IF EXISTS idx_entities_name_trgm",
+     "CREATE INDEX IF NOT EXISTS idx_entities_name_trgm ON entities USING gin(name gin_trgm_ops)"),
+    ("DROP INDEX IF EXISTS idx_relationships_subject",
+     "CREATE INDEX IF NOT EXISTS idx_relationships_subject ON relationships(subject_id)"),
+    ("DROP INDEX IF EXISTS idx_relationships_object",
+     "CREATE INDEX IF NOT EXISTS idx_relationships_object ON relationships(object_id)"),
+    ("DROP INDEX IF EXISTS idx_relationships_predicate",
+     "CREATE INDEX IF NOT EXISTS idx_relationships_predicate ON relationships(predicate)"),
+    ("ALTER TABLE relationships DROP CONSTRAINT IF EXISTS relationships_subject_id_fkey",
+     "ALTER TABLE relationships ADD CONSTRAINT relationships_subject_id_fkey "
+     "FOREIGN KEY (subject_id) REFERENCES entities(id)"),
+    ("ALTER TABLE relationships DROP CONSTRAINT IF EXISTS relationships_object_id_fkey",
+     "ALTER TABLE relationships ADD CONSTRAINT relationships_object_id_fkey "
+     "FOREIGN KEY (object_id) REFERENCES entities(id)"),
+]
+
+
+def _drop_bulk_load_indexes(pg_pool):
+    """Drop secondary indexes and FKs so the bulk load skips per-row maintenance."""
+    print("\n🧹 Dropping secondary indexes for bulk load...")
+    pg_conn = pg_pool.getconn()
+    try:
+        with pg_conn, pg_conn.cursor() as pg_cursor:
+            for drop_sql, _ in BULK_LOAD_INDEXES:
+                pg_cursor.execute(drop_sql)
+    finally:
+        pg_pool.putconn(pg_conn)
+
+
+def _rebuild_bulk_load_indexes(pg_pool):
+    """Recreate the indexes and FKs dropped by _drop_bulk_load_indexes."""
+    print("\n🧱 Rebuilding secondary indexes...")
+    pg_conn = pg_pool.getconn()
+    try:
+        with pg_conn, pg_conn.cursor() as pg_cursor:
+            for _, create_sql in BULK_LOAD_INDEXES:
+                pg_cursor.execute(create_sql)
+    finally:
+        pg_pool.putconn(pg_conn)
+
+
+def _migrate_article_tables(pg_pool, articles_db: str):
+    """Migrate feeds and articles on a pooled connection, committing per table."""
+    sqlite_conn = get_sqlite_conn(articles_db)
+    pg_conn = pg_pool.getconn()
+    try:
+        with pg_conn.cursor() as pg_cursor:
+            # `with pg_conn` commits on success and rolls back on error
+            with pg_conn:
+                migrate_feeds(sqlite_conn, pg_cursor)
+            with pg_conn:
+                migrate_articles(sqlite_conn, pg_cursor)
+    finally:
+        pg_pool.putconn(pg_conn)
+        sqlite_conn.close()
+
+
+def _migrate_graph_tables(pg_pool, kg_db: str):
+    """Migrate entities, relationships and enrichment on a pooled connection, committing per table."""
+    sqlite_conn = get_sqlite_conn(kg_db)
+    pg_conn = pg_pool.getconn()
+    try:
+        with pg_conn.cursor() as pg_cursor:
+            with pg_conn:
+                entity_id_mapping = migrate_entities(sqlite_conn, pg_cursor)
+            with pg_conn:
+                migrate_relationships(sqlite_conn, pg_cursor, entity_id_mapping)
+            with pg_conn:
+                migrate_enrichment(sqlite_conn, pg_cursor, entity_id_mapping)
+    finally:
+        pg_pool.putconn(pg_conn)
+        sqlite_conn.close()
+
+
 def main():
     """Main migration function."""
     print("=" * 60)
@@ -304,43 +501,51 @@ def main():
         print(f"\n❌ ERROR: {kg_db} not found!")
         sys.exit(1)
 
-    # Connect to databases
+    # Connect to PostgreSQL (SQLite connections are opened per task, since
+    # sqlite3 connections can't be shared across threads)
     print("\n📂 Connecting to databases...")
-    articles_conn = get_sqlite_conn(articles_db)
-    kg_conn = get_sqlite_conn(kg_db)
-
     try:
-        pg_conn = psycopg2.connect(database_url)
-        pg_conn.autocommit = False
-        pg_cursor = pg_conn.cursor()
+        pg_pool = ThreadedConnectionPool(minconn=2, maxconn=4, dsn=database_url)
         print("   ✓ Connected to Supabase PostgreSQL")
     except Exception as e:
         print(f"\n❌ ERROR: Failed to connect to PostgreSQL: {e}")
         sys.exit(1)
 
     try:
-        # Run migrations
-        migrate_feeds(articles_conn, pg_cursor)
-        migrate_articles(articles_conn, pg_cursor)
-        entity_id_mapping = migrate_entities(kg_conn, pg_cursor)
-        migrate_relationships(kg_conn, pg_cursor, entity_id_mapping)
-        migrate_enrichment(kg_conn, pg_cursor, entity_id_mapping)
-
-        # Commit all changes
-        pg_conn.commit()
+        _drop_bulk_load_indexes(pg_pool)
+        try:
+            # Article tables and graph tables are independent, so migrate them
+            # concurrently, each on its own connection and transaction
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(_migrate_article_tables, pg_pool, articles_db),
+                    executor.submit(_migrate_graph_tables, pg_pool, kg_db),
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            _rebuild_bulk_load_indexes(pg_pool)
+
         print("\n" + "=" * 60)
         print("✅ Migration completed successfully!")
         print("=" * 60)
 
         # Print summary
-        pg_cursor.execute("SELECT COUNT(*) FROM articles")
-        articles_count = pg_cursor.fetchone()[0]
+        pg_conn = pg_pool.getconn()
+        try:
+            pg_cursor = pg_conn.cursor()
 
-        pg_cursor.execute("SELECT COUNT(*) FROM entities")
-        entities_count = pg_cursor.fetchone()[0]
+            # One round trip for all three counts
+            pg_cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM articles),
+                       (SELECT COUNT(*) FROM entities),
+                       (SELECT COUNT(*) FROM relationships)
+            """)
+            articles_count, entities_count, relationships_count = pg_cursor.fetchone()
 
-        pg_cursor.execute("SELECT COUNT(*) FROM relationships")
-        relationships_count = pg_cursor.fetchone()[0]
+            pg_cursor.close()
+        finally:
+            pg_pool.putconn(pg_conn)
 
         print(f"\n📊 Final counts in Supabase:")
         print(f"   Articles:      {articles_count}")
@@ -348,15 +553,11 @@ def main():
         print(f"   Relationships: {relationships_count}")
 
     except Exception as e:
-        pg_conn.rollback()
         print(f"\n❌ ERROR: Migration failed: {e}")
-        print("   Transaction rolled back - no data was modified")
+        print("   The failing table's transaction was rolled back; tables migrated before it stay committed")
         raise
     finally:
-        pg_cursor.close()
-        pg_conn.close()
-        articles_conn.close()
-        kg_conn.close()
+        pg_pool.closeall()
 
 
 if __name__ == "__main__":
@@ -5,10 +5,15 @@ import asyncio
 import sys
 from pathlib import Path
 
+import structlog
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.pipeline.daily import run_daily_pipeline
 
+# Let each module-level logger resolve its configuration once, on first use
+structlog.configure(cache_logger_on_first_use=True)
+
 
 def main():
     print("\n" + "=" * 50)
@@ -85,6 +85,7 @@ CREATE TABLE IF NOT EXISTS entities (
     enrichment_status VARCHAR(20) DEFAULT 'pending',
     enriched_at TIMESTAMP WITH TIME ZONE,
     enrichment_data JSONB DEFAULT '{}',
+    enrichment_source VARCHAR(50),  -- "web_search", "internal", ...
 
     first_seen_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     last_seen_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -94,6 +95,9 @@ CREATE TABLE IF NOT EXISTS entities (
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Databases created before enrichment_source existed
+ALTER TABLE entities ADD COLUMN IF NOT EXISTS enrichment_source VARCHAR(50);
+
 CREATE INDEX IF NOT EXISTS idx_entities_normalized ON entities(normalized_name);
 CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(entity_type);
 CREATE INDEX IF NOT EXISTS idx_entities_canonical ON entities(canonical_id) WHERE canonical_id IS NOT NULL;
@@ -16,6 +16,7 @@ Environment Variables:
     LLM_PROVIDER: gemini, anthropic, or openai
     GEMINI_API_KEY / ANTHROPIC_API_KEY / OPENAI_API_KEY
     SLACK_WEBHOOK_URL: Optional, for alerts
+    ENRICHMENT_CONCURRENCY: Optional, max parallel enrichment requests (default 8)
 """
 
 import os
@@ -24,12 +25,22 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 import signal
+from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import httpx
 import structlog
 
+from src.storage.factory import get_article_storage, get_knowledge_graph
+from src.pipeline.daily import DailyPipeline
+from src.knowledge_graph.entity_resolver import EntityResolver
+from src.enrichment.enrichment_service import EnrichmentService, close_shared_connector
+from src.newsletter.generator import NewsletterGenerator
+
+# Let each module-level logger resolve its configuration once, on first use
+structlog.configure(cache_logger_on_first_use=True)
 logger = structlog.get_logger()
 
 # Check for required dependencies
@@ -47,12 +58,21 @@ class PipelineWorker:
     """Manages scheduled pipeline tasks."""
 
     def __init__(self):
-        from src.storage.factory import get_article_storage, get_knowledge_graph
-
         self.storage = get_article_storage()
         self.kg = get_knowledge_graph()
+        # Built once so classifier/extractor setup is not repeated every job
+        self.pipeline = DailyPipeline(
+            storage=self.storage,
+            kg=self.kg,
+            use_form_d=os.environ.get('ENABLE_FORM_D', 'true').lower() == 'true',
+            use_gdelt=False,
+            use_layoffs=os.environ.get('ENABLE_LAYOFFS', 'true').lower() == 'true',
+            use_yc=os.environ.get('ENABLE_YC', 'true').lower() == 'true',
+        )
         self.scheduler = AsyncIOScheduler() if SCHEDULER_AVAILABLE else None
         self.running = True
+        # Created on first alert and kept open so bursts reuse the connection
+        self._alert_client: Optional[httpx.AsyncClient] = None
 
     def setup_jobs(self):
         """Configure scheduled jobs."""
@@ -126,19 +146,8 @@ class PipelineWorker:
         start_time = datetime.now()
 
         try:
-            from src.pipeline.daily import DailyPipeline
-
-            pipeline = DailyPipeline(
-                storage=self.storage,
-                kg=self.kg,
-                use_form_d=os.environ.get('ENABLE_FORM_D', 'true').lower() == 'true',
-                use_gdelt=False,
-                use_layoffs=os.environ.get('ENABLE_LAYOFFS', 'true').lower() == 'true',
-                use_yc=os.environ.get('ENABLE_YC', 'true').lower() == 'true',
-            )
-
             # Just fetch, don't process
-            articles = await pipeline._fetch(days_back=1)
+            articles = await self.pipeline._fetch(days_back=1)
             saved = self.storage.save_articles(articles)
 
             elapsed = (datetime.now() - start_time).total_seconds()
@@ -158,20 +167,16 @@ class PipelineWorker:
         start_time = datetime.now()
 
         try:
-            from src.pipeline.daily import DailyPipeline
-
-            pipeline = DailyPipeline(storage=self.storage, kg=self.kg)
-
             # Get unprocessed articles
             max_articles = int(os.environ.get('MAX_ARTICLES_PER_RUN', 200))
             unprocessed = self.storage.get_unprocessed(limit=max_articles)
 
             # Classify
-            high_signal = pipeline._classify(unprocessed)
+            high_signal = self.pipeline._classify(unprocessed)
 
             # Extract high signal articles
             to_extract = self.storage.get_unextracted_high_signal(limit=max_articles // 2)
-            extracted = await pipeline._extract(to_extract)
+            extracted = await self.pipeline._extract(to_extract)
 
             elapsed = (datetime.now() - start_time).total_seconds()
             logger.info("job_completed", job="process_articles",
@@ -197,8 +202,6 @@ class PipelineWorker:
         start_time = datetime.now()
 
         try:
-            from src.knowledge_graph.entity_resolver import EntityResolver
-
             resolver = EntityResolver(self.kg)
             result = resolver.run_all()
 
@@ -219,23 +222,28 @@ class PipelineWorker:
         start_time = datetime.now()
 
         try:
-            from src.enrichment.enrichment_service import EnrichmentService
-
             service = EnrichmentService(self.kg)
             limit = int(os.environ.get('ENRICHMENT_REQUESTS_PER_DAY', 50))
 
-            # Get unenriched entities
-            entities = self.kg.search_entities('', entity_type='company')
-            unenriched = [e for e in entities if not self.kg.get_enrichment(e.id)]
+            # Get unenriched entities (filtered in the database)
+            unenriched = self.kg.get_unenriched_companies(limit=limit)
+
+            # Enrich concurrently, bounded by a semaphore
+            semaphore = asyncio.Semaphore(int(os.environ.get('ENRICHMENT_CONCURRENCY', 8)))
+
+            async def enrich_one(entity) -> bool:
+                async with semaphore:
+                    try:
+                        await service.enrich_company(entity.id)
+                        return True
+                    except Exception as e:
+                        logger.warning("enrichment_failed", entity=entity.name, error=str(e))
+                        return False
+                    finally:
+                        await asyncio.sleep(1)  # Rate limiting (per concurrent slot)
 
-            enriched_count = 0
-            for entity in unenriched[:limit]:
-                try:
-                    await service.enrich_company(entity.id)
-                    enriched_count += 1
-                    await asyncio.sleep(1)  # Rate limiting
-                except Exception as e:
-                    logger.warning("enrichment_failed", entity=entity.name, error=str(e))
+            results = await asyncio.gather(*(enrich_one(e) for e in unenriched))
+            enriched_count = sum(results)
 
             await service.close()
 
@@ -256,9 +264,6 @@ class PipelineWorker:
         start_time = datetime.now()
 
         try:
-            from src.newsletter.generator import NewsletterGenerator
-            from pathlib import Path
-
             gen = NewsletterGenerator()
             newsletter = gen.generate_daily()
             html = gen.to_html(newsletter)
@@ -320,18 +325,21 @@ class PipelineWorker:
             return
 
         try:
-            import httpx
-
             emoji = {
                 "info": "ℹ️",
                 "warning": "⚠️",
                 "error": "🚨"
             }.get(level, "📢")
 
-            async with httpx.AsyncClient() as client:
-                await client.post(webhook_url, json={
-                    "text": f"{emoji} *Recruiter Intelligence*\n{message}"
-                })
+            if self._alert_client is None:
+                self._alert_client = httpx.AsyncClient(
+                    timeout=5.0,
+                    limits=httpx.Limits(max_keepalive_connections=2),
+                )
+
+            await self._alert_client.post(webhook_url, json={
+                "text": f"{emoji} *Recruiter Intelligence*\n{message}"
+            })
         except Exception as e:
             logger.error("alert_failed", error=str(e))
 
@@ -353,43 +361,43 @@ class PipelineWorker:
             self.scheduler.shutdown(wait=True)
         logger.info("worker_stopped")
 
+    async def close(self):
+        """Release network resources held by the worker."""
+        if self._alert_client is not None:
+            await self._alert_client.aclose()
+            self._alert_client = None
+        await close_shared_connector()
+
 
 async def run_simple_loop(worker: PipelineWorker):
-    """Simple loop fallback when APScheduler is not available."""
-    last_fetch = None
-    last_process = None
-    last_resolve = None
-    last_newsletter = None
+    """Simple loop fallback when APScheduler is not available.
+
+    Each job keeps its own next-run deadline, so waiting on one job (e.g.
+    process 30 min after fetch) never delays the others.
+    """
+    jobs = [
+        ('fetch', worker.fetch_articles, timedelta(hours=6)),
+        ('process', worker.process_articles, timedelta(hours=6)),
+        ('resolve', worker.resolve_entities, timedelta(days=1)),
+        ('newsletter', worker.generate_newsletter, timedelta(days=1)),
+        ('health', worker.health_check, timedelta(hours=1)),
+    ]
+
+    start = datetime.now()
+    next_run = {name: start for name, _, _ in jobs}
+    next_run['process'] = start + timedelta(minutes=30)  # Process 30 min after fetch
 
     while worker.running:
-        now = datetime.now()
-
-        # Fetch every 6 hours
-        if last_fetch is None or (now - last_fetch) >= timedelta(hours=6):
-            await worker.fetch_articles()
-            last_fetch = now
-
-        # Process 30 min after fetch
-        if last_process is None or (now - last_process) >= timedelta(hours=6):
-            await asyncio.sleep(60 * 30)  # Wait 30 min
-            await worker.process_articles()
-            last_process = now
-
-        # Resolve daily
-        if last_resolve is None or (now - last_resolve) >= timedelta(days=1):
-            await worker.resolve_entities()
-            last_resolve = now
-
-        # Newsletter daily
-        if last_newsletter is None or (now - last_newsletter) >= timedelta(days=1):
-            await worker.generate_newsletter()
-            last_newsletter = now
-
-        # Health check
-        await worker.health_check()
+        for name, job, interval in jobs:
+            now = datetime.now()
+            if next_run[name] <= now:
+                await job()
+                next_run[name] = now + interval
 
-        # Sleep for an hour
-        await asyncio.sleep(3600)
+        # Sleep until the earliest deadline, waking at least once a minute
+        # so a shutdown signal is noticed promptly
+        sleep_for = (min(next_run.values()) - datetime.now()).total_seconds()
+        await asyncio.sleep(min(max(1, sleep_for), 60))
 
 
 async def main():
@@ -423,6 +431,7 @@ async def main():
         await run_simple_loop(worker)
 
     worker.stop()
+    await worker.close()
 
 
 if __name__ == "__main__":
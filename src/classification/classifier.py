@@ -1,12 +1,73 @@
 """Keyword-based classifier for fast article classification."""
 
+import hashlib
 import re
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, Optional
 from .interfaces import (
     ClassifierInterface, ClassificationResult,
     EventType, QualityScore, QualityEvaluatorInterface
 )
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _expand_literal(pattern: str):
+    """Expand a simple keyword pattern into the literal strings it matches.
+
+    Handles surrounding \\b anchors, optional characters (``s?``) and
+    character ranges (``[a-e]``). Returns (literals, bounded), or None if
+    the pattern needs the regex engine.
+    """
+    bounded = pattern.startswith(r"\b")
+    body = pattern
+    if bounded:
+        if not pattern.endswith(r"\b"):
+            return None
+        body = pattern[2:-2]
+
+    variants = [""]
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if c == "[" and re.match(r"\[[a-z]-[a-z]\]", body[i:i + 5]):
+            options = [chr(o) for o in range(ord(body[i + 1]), ord(body[i + 3]) + 1)]
+            i += 5
+        elif c.islower() or c.isdigit() or c == " ":
+            if body[i + 1:i + 2] == "?":
+                options = ["", c]
+                i += 2
+            else:
+                options = [c]
+                i += 1
+        else:
+            return None
+        variants = [v + o for v in variants for o in options]
+
+    return variants, bounded
+
+
+def _anchor_literals(pattern: str):
+    """Literals that must occur in any text matched by a regex pattern.
+
+    Uses the plain keyword the pattern starts with (e.g. ``raises?`` in
+    ``\\braises?\\b.*\\$``). Returns None if there is no such prefix.
+    """
+    prefix = re.match(r"\\b((?:[a-z ]\??)+)", pattern)
+    if not prefix:
+        return None
+    literals, _ = _expand_literal(prefix.group(1))
+    return tuple(literals)
+
+
+def _is_word_char(c: str) -> bool:
+    """Match the regex engine's notion of a \\w character."""
+    return c.isalnum() or c == "_"
+
 
 class KeywordClassifier(ClassifierInterface):
     """Fast keyword-based classifier for initial filtering."""
@@ -56,45 +117,151 @@ class KeywordClassifier(ClassifierInterface):
         }
     }
 
+    # Results kept per instance; articles re-fetched from several feeds
+    # or re-run on incremental passes skip the scan. Keyed by a digest, so
+    # the article text isn't kept, but a greedy match ('raises .* $') in
+    # matched_keywords can be most of an article: about one run's worth.
+    CACHE_SIZE = 512
+
     def __init__(self):
         self._compile_patterns()
+        self._cache: "OrderedDict[tuple, ClassificationResult]" = OrderedDict()
 
     def _compile_patterns(self):
-        """Compile regex patterns for efficiency."""
-        self.compiled = {}
-        for event_type, patterns in self.PATTERNS.items():
-            self.compiled[event_type] = {
-                "strong": [re.compile(p, re.IGNORECASE) for p in patterns["strong"]],
-                "weak": [re.compile(p, re.IGNORECASE) for p in patterns["weak"]]
-            }
+        """Compile patterns for efficiency.
+
+        Plain keywords also go into a single Aho-Corasick automaton so the
+        text is scanned once for all of them; only patterns that need the
+        regex engine (e.g. ``.*`` or ``\\s+``) are then run individually,
+        and only when the keyword they start with occurs in the text.
+        """
+        # Scores are kept in a list indexed by position in PATTERNS
+        self._event_types = list(self.PATTERNS)
+
+        # Flat (event index, weight, pattern) tuples for the regex path
+        self._scans = tuple(
+            (idx, weight, re.compile(p, re.IGNORECASE))
+            for idx, patterns in enumerate(self.PATTERNS.values())
+            for strength, weight in (("strong", 2), ("weak", 0.5))
+            for p in patterns[strength]
+        )
+
+        self.automaton = None
+        if not AHOCORASICK_AVAILABLE:
+            return
+
+        self.automaton = ahocorasick.Automaton()
+        residual = []
+        keywords: Dict[str, list] = {}
+        for idx, weight, pattern in self._scans:
+            expanded = _expand_literal(pattern.pattern)
+            if expanded is None:
+                residual.append((idx, weight, pattern, _anchor_literals(pattern.pattern)))
+                continue
+            literals, bounded = expanded
+            for literal in literals:
+                keywords.setdefault(literal, []).append((idx, weight, bounded))
+        self._residual_scans = tuple(residual)
+
+        for literal, hits in keywords.items():
+            self.automaton.add_word(literal, (len(literal), hits))
+        self.automaton.make_automaton()
+
+    def _scan_keywords(self, text: str, scores: list, matched: set) -> Optional[str]:
+        """Count automaton keyword hits in text, honouring \\b anchors.
+
+        Returns the lowercased text, or None if the text can't be scanned
+        this way (lowercasing changed its length), in which case the caller
+        falls back to regex.
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            return None
+
+        n = len(text)
+        for end, (length, hits) in self.automaton.iter(lowered):
+            start = end - length + 1
+            at_boundary = (
+                (start == 0 or not _is_word_char(lowered[start - 1]))
+                and (end + 1 == n or not _is_word_char(lowered[end + 1]))
+            )
+            for idx, weight, bounded in hits:
+                if bounded and not at_boundary:
+                    continue
+                scores[idx] += weight
+                matched.add(text[start:end + 1])
+        return lowered
+
+    def _scan_residual(self, text: str, lowered: str, scores: list, matched: set) -> None:
+        """Count hits for the regex-only patterns whose anchor keyword occurs."""
+        for idx, weight, pattern, anchors in self._residual_scans:
+            if anchors and not any(a in lowered for a in anchors):
+                continue
+            found = pattern.findall(text)
+            scores[idx] += len(found) * weight
+            matched.update(found)
+
+    def _scan_regex(self, text: str, scores: list, matched: set) -> None:
+        """Count regex pattern hits in text."""
+        for idx, weight, pattern in self._scans:
+            found = pattern.findall(text)
+            scores[idx] += len(found) * weight
+            matched.update(found)
+
+    def _scan(self, text: str, scores: list, matched: set) -> None:
+        """Add weighted pattern hits in text to scores and the matched set."""
+        lowered = None
+        if self.automaton is not None:
+            lowered = self._scan_keywords(text, scores, matched)
+
+        if lowered is not None:
+            self._scan_residual(text, lowered, scores, matched)
+        else:
+            self._scan_regex(text, scores, matched)
 
     def classify(self, title: str, content: str) -> ClassificationResult:
-        """Classify article by event type."""
-        # Weight title more heavily
-        text = f"{title} {title} {content}"
+        """Classify article by event type.
+
+        Results are deterministic, so repeated (title, content) pairs are
+        answered from an LRU cache.
+        """
+        key = self._cache_key(title, content)
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            return result
 
-        scores = {}
-        all_matches = []
+        result = self._classify(title, content)
+        self._cache[key] = result
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
 
-        for event_type, patterns in self.compiled.items():
-            score = 0
-            matches = []
+    @staticmethod
+    def _cache_key(title: str, content: str) -> tuple:
+        """SHA-256 of the article text, plus its lengths as a collision check."""
+        title, content = f"{title}", f"{content}"
+        digest = hashlib.sha256(
+            f"{title}\0{content}".encode("utf-8", "surrogatepass")
+        ).digest()
+        return len(title), len(content), digest
 
-            for pattern in patterns["strong"]:
-                found = pattern.findall(text)
-                score += len(found) * 2
-                matches.extend(found)
+    def _classify(self, title: str, content: str) -> ClassificationResult:
+        scores = [0] * len(self._event_types)
+        # Every hit scores, so this is exactly the keywords of the scored types
+        matched = set()
 
-            for pattern in patterns["weak"]:
-                found = pattern.findall(text)
-                score += len(found) * 0.5
-                matches.extend(found)
+        # Weight title more heavily. Scanned as one line: greedy patterns such
+        # as 'raises .* $' match once across the repeated title, not per copy
+        self._scan(f"{title} {title} {content}", scores, matched)
 
-            if score > 0:
-                scores[event_type] = score
-                all_matches.extend(matches)
+        # Stable sort: ties keep PATTERNS order
+        ranked = sorted(
+            (idx for idx, score in enumerate(scores) if score > 0),
+            key=scores.__getitem__, reverse=True
+        )
 
-        if not scores:
+        if not ranked:
             return ClassificationResult(
                 primary_type=EventType.OTHER,
                 all_types=[EventType.OTHER],
@@ -103,16 +270,15 @@ class KeywordClassifier(ClassifierInterface):
                 is_high_signal=False
             )
 
-        # Sort by score
-        sorted_types = sorted(scores.keys(), key=lambda t: scores[t], reverse=True)
+        sorted_types = [self._event_types[idx] for idx in ranked]
         primary = sorted_types[0]
-        confidence = min(1.0, scores[primary] / 5.0)
+        confidence = min(1.0, scores[ranked[0]] / 5.0)
 
         return ClassificationResult(
             primary_type=primary,
             all_types=sorted_types,
             confidence=confidence,
-            matched_keywords=list(set(all_matches)),
+            matched_keywords=list(matched),
             is_high_signal=primary != EventType.OTHER and confidence >= 0.5
         )
 
@@ -131,19 +297,24 @@ class QualityEvaluator(QualityEvaluatorInterface):
     """Evaluates extraction quality potential."""
 
     AMOUNT_PATTERN = re.compile(r'\$[\d,.]+\s*(million|billion|M|B)?', re.IGNORECASE)
+    # The patterns below run on lowercased text. Matching case-sensitively
+    # there is several times faster than re.IGNORECASE on the raw text.
+    COMPANY_PATTERN = re.compile(r'(inc\.|corp\.|llc|ltd\.)')
+    DATE_PATTERN = re.compile(
+        r'(january|february|march|april|may|june|july|august|september|october|november|december|\d{4})'
+    )
     PERSON_INDICATORS = ["ceo", "cto", "cfo", "founder", "president", "partner", "executive", "chief"]
+    # Whole words only (plurals allowed), so "partnership" doesn't count
+    PERSON_PATTERN = re.compile(r'\b(?:' + '|'.join(PERSON_INDICATORS) + r')s?\b')
 
     def evaluate(self, title: str, content: str) -> QualityScore:
         """Evaluate extraction potential."""
         text = f"{title} {content}".lower()
 
         has_amounts = bool(self.AMOUNT_PATTERN.search(text))
-        has_persons = any(ind in text for ind in self.PERSON_INDICATORS)
-        has_companies = bool(re.search(r'(inc\.|corp\.|llc|ltd\.)', text, re.IGNORECASE))
-        has_dates = bool(re.search(
-            r'(january|february|march|april|may|june|july|august|september|october|november|december|\d{4})',
-            text
-        ))
+        has_persons = bool(self.PERSON_PATTERN.search(text))
+        has_companies = bool(self.COMPANY_PATTERN.search(text))
+        has_dates = bool(self.DATE_PATTERN.search(text))
 
         factors = [has_amounts, has_persons, has_companies, has_dates]
         score = sum(factors) / len(factors)
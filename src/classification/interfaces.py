@@ -15,7 +15,7 @@ class EventType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassificationResult:
     """Result of classifying an article."""
     primary_type: EventType
@@ -25,7 +25,7 @@ class ClassificationResult:
     is_high_signal: bool  # True if not OTHER and confidence > threshold
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QualityScore:
     """Quality assessment for extraction potential."""
     overall_score: float  # 0.0 to 1.0
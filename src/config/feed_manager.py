@@ -1,16 +1,29 @@
 """Feed management - CRUD operations for RSS feeds."""
 
+import asyncio
 import json
 import os
 import tempfile
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 import aiohttp
 import feedparser
 import structlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 from .feeds import load_feeds
 from ..storage.database import ArticleStorage
 
@@ -19,6 +32,72 @@ logger = structlog.get_logger()
 # Default config path
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "feeds.json"
 
+# Parsed feeds.json (plus a name -> feed index) per path, keyed by
+# (mtime_ns, size) so edits are picked up. Module-level because the
+# dashboard creates a FeedManager per request.
+_config_cache: Dict[Path, Tuple[Tuple[int, int], dict, Dict[str, dict]]] = {}
+
+
+def _cache_config(path: Path, config: dict) -> Tuple[dict, Dict[str, dict]]:
+    """Store a parsed config for the file's current version."""
+    st = path.stat()
+    by_name = {}
+    for feed in config.get("feeds", []):
+        by_name.setdefault(feed["name"], feed)  # First entry wins, as in a linear scan
+    _config_cache[path] = ((st.st_mtime_ns, st.st_size), config, by_name)
+    return config, by_name
+
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_RDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+
+
+def _summarize_feed_xml(content: bytes) -> Optional[Tuple[str, int]]:
+    """Read a feed's title and entry count with lxml.
+
+    Returns None when the document isn't well-formed RSS/Atom, so the
+    caller can fall back to feedparser's lenient parse.
+    """
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    try:
+        root = etree.fromstring(content, parser)
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+
+    if root.tag == "rss":
+        channel = root.find("channel")
+        if channel is None:
+            return None
+        title = channel.find("title")
+        count = len(channel.findall("item"))
+    elif root.tag == f"{_ATOM}feed":
+        title = root.find(f"{_ATOM}title")
+        count = len(root.findall(f"{_ATOM}entry"))
+    elif root.tag == f"{_RDF}RDF":
+        title = root.find(f"{_RSS1}channel/{_RSS1}title")
+        count = len(root.findall(f"{_RSS1}item"))
+    else:
+        return None
+
+    if title is None:
+        return "Unknown Feed", count
+    return "".join(title.itertext()).strip(), count
+
+
+def _summarize_feed(content: bytes) -> Optional[Tuple[str, int]]:
+    """Get a feed's title and entry count, or None if it isn't a feed."""
+    if LXML_AVAILABLE:
+        summary = _summarize_feed_xml(content)
+        if summary is not None:
+            return summary
+
+    # Malformed or unusual feeds: feedparser is slower but tolerant
+    feed = feedparser.parse(content)
+    if feed.bozo and not feed.entries:
+        return None
+    return feed.feed.get("title", "Unknown Feed"), len(feed.entries)
+
 # Suggested feeds for one-click add
 SUGGESTED_FEEDS = [
     # Regional
@@ -98,13 +177,27 @@ class FeedManager:
     def __init__(self, config_path: str = None, storage: ArticleStorage = None):
         self.config_path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
         self.storage = storage or ArticleStorage()
+        self._session = None
 
     def _load_config(self) -> dict:
-        """Load the feeds.json config file."""
-        if not self.config_path.exists():
-            return {"feeds": [], "settings": {}}
-        with open(self.config_path) as f:
-            return json.load(f)
+        """Load the feeds.json config file, reusing the parsed copy if unchanged."""
+        return self._load_indexed_config()[0]
+
+    def _load_indexed_config(self) -> Tuple[dict, Dict[str, dict]]:
+        """Load the config along with its feeds indexed by name."""
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
+            return {"feeds": [], "settings": {}}, {}
+
+        cached = _config_cache.get(self.config_path)
+        if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+            return cached[1], cached[2]
+
+        with open(self.config_path, 'rb') as f:
+            data = f.read()
+        config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        return _cache_config(self.config_path, config)
 
     def _save_config(self, config: dict) -> None:
         """Save config atomically (write to temp, then rename)."""
@@ -114,12 +207,18 @@ class FeedManager:
             suffix=".json"
         )
         try:
-            with os.fdopen(fd, 'w') as f:
-                json.dump(config, f, indent=2)
+            with os.fdopen(fd, 'wb') as f:
+                if ORJSON_AVAILABLE:
+                    f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(config, indent=2).encode())
             # Atomic rename
             os.replace(temp_path, self.config_path)
+            _cache_config(self.config_path, config)
             logger.info("feeds_config_saved", path=str(self.config_path))
         except Exception:
+            # The caller may have mutated the cached dict; force a re-read
+            _config_cache.pop(self.config_path, None)
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
             raise
@@ -130,33 +229,34 @@ class FeedManager:
         feeds = config.get("feeds", [])
 
         # Get stats from database
-        stats_by_name = {s["feed_name"]: s for s in self.storage.get_all_feed_stats()}
-
-        result = []
-        for feed in feeds:
-            stats = stats_by_name.get(feed["name"], {})
-            result.append({
-                **feed,
-                "enabled": feed.get("enabled", True),
-                "stats": {
-                    "total_articles": stats.get("total_articles", 0),
-                    "high_signal_articles": stats.get("high_signal_articles", 0),
-                    "success_rate": stats.get("success_rate", 1.0),
-                    "last_fetch_at": stats.get("last_fetch_at"),
-                    "last_error": stats.get("last_error"),
-                    "consecutive_failures": stats.get("consecutive_failures", 0),
-                }
-            })
+        stats_by_name = self.storage.get_feed_stats_map()
 
-        return result
+        return [self._with_stats(feed, stats_by_name.get(feed["name"])) for feed in feeds]
 
     def get_feed(self, name: str) -> Optional[dict]:
         """Get a specific feed by name."""
-        feeds = self.list_feeds()
-        for feed in feeds:
-            if feed["name"] == name:
-                return feed
-        return None
+        _, by_name = self._load_indexed_config()
+        feed = by_name.get(name)
+        if feed is None:
+            return None
+        return self._with_stats(feed, self.storage.get_feed_stats(name))
+
+    @staticmethod
+    def _with_stats(feed: dict, stats: Optional[dict]) -> dict:
+        """Merge a feed's config entry with its fetch stats."""
+        stats = stats or {}
+        return {
+            **feed,
+            "enabled": feed.get("enabled", True),
+            "stats": {
+                "total_articles": stats.get("total_articles", 0),
+                "high_signal_articles": stats.get("high_signal_articles", 0),
+                "success_rate": stats.get("success_rate", 1.0),
+                "last_fetch_at": stats.get("last_fetch_at"),
+                "last_error": stats.get("last_error"),
+                "consecutive_failures": stats.get("consecutive_failures", 0),
+            }
+        }
 
     def add_feed(
         self,
@@ -195,12 +295,15 @@ class FeedManager:
 
         for i, feed in enumerate(config["feeds"]):
             if feed["name"] == name:
-                # Apply updates
+                # Apply updates, only rewriting the file if something changed
+                changed = False
                 for key, value in updates.items():
-                    if key in ["url", "priority", "event_types", "enabled"]:
+                    if key in ["url", "priority", "event_types", "enabled"] and feed.get(key) != value:
                         config["feeds"][i][key] = value
-                self._save_config(config)
-                logger.info("feed_updated", name=name, updates=updates)
+                        changed = True
+                if changed:
+                    self._save_config(config)
+                    logger.info("feed_updated", name=name, updates=updates)
                 return True
 
         return False
@@ -223,32 +326,43 @@ class FeedManager:
         """Enable or disable a feed."""
         return self.update_feed(name, enabled=enabled)
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the HTTP session shared by feed validations."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16),
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
+
+    async def close(self):
+        """Close HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
     async def validate_feed_url(self, url: str) -> dict:
         """Validate a feed URL by attempting to fetch and parse it."""
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=15)
-            ) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return {
-                            "valid": False,
-                            "error": f"HTTP {response.status}",
-                        }
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return {
+                        "valid": False,
+                        "error": f"HTTP {response.status}",
+                    }
 
-                    content = await response.text()
+                content = await response.read()
 
-            # Parse with feedparser
-            feed = feedparser.parse(content)
+            # Parse off the event loop so concurrent validations overlap
+            summary = await asyncio.to_thread(_summarize_feed, content)
 
-            if feed.bozo and not feed.entries:
+            if summary is None:
                 return {
                     "valid": False,
                     "error": "Not a valid RSS/Atom feed",
                 }
 
-            title = feed.feed.get("title", "Unknown Feed")
-            item_count = len(feed.entries)
+            title, item_count = summary
 
             return {
                 "valid": True,
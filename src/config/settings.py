@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     openai_api_key: Optional[str] = None
     llm_model: str = "gemini-2.0-flash"  # or "gemini-2.5-flash" for thinking
     llm_max_tokens: int = 2000
+    llm_max_output_tokens: int = 8192  # Model's output ceiling; bounds multi-article calls
     llm_temperature: float = 0.0
 
     # Ingestion
@@ -47,6 +48,9 @@ class Settings(BaseSettings):
     extraction_confidence_threshold: float = 0.6
     max_articles_per_run: int = 500
 
+    # Enrichment
+    enrichment_cache_ttl_hours: int = 24  # Bulk runs reuse enrichments younger than this
+
     # Features
     enable_llm_extraction: bool = True
     enable_full_content_fetch: bool = False
@@ -1,14 +1,30 @@
 """Enrichment service for fetching external data about entities using web search."""
 
 import asyncio
+import bisect
 import json
 import re
+import weakref
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, List
 from urllib.parse import quote_plus
 
 import aiohttp
 import structlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from .interfaces import CompanyEnrichment, PersonEnrichment, EnrichmentResult
 from ..knowledge_graph.graph import KnowledgeGraph
 from ..config.settings import settings
@@ -18,6 +34,253 @@ logger = structlog.get_logger()
 # Gemini API endpoint for grounded search (using latest model)
 GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent"
 
+# Request body for a grounded search, minus the query contents
+GEMINI_SEARCH_PAYLOAD = {
+    "tools": [{
+        "google_search": {}
+    }],
+    "generationConfig": {
+        "temperature": 0.1,
+        "maxOutputTokens": 2000
+    }
+}
+
+
+def _compile_all(*patterns: str) -> tuple:
+    return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+
+
+def _mentions(text_lower: str, words: tuple) -> bool:
+    """Whether lowercased text contains any of the words."""
+    return any(w in text_lower for w in words)
+
+
+class _KeywordSet:
+    """Case-insensitive search for the leftmost of a set of literal keywords.
+
+    Equivalent to re.search over the keywords' alternation, but scans the
+    text once with an Aho-Corasick automaton when pyahocorasick is
+    installed. None of the keywords may be a prefix of another.
+    """
+
+    def __init__(self, *keywords: str):
+        self.pattern = re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+        self.automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self.max_len = max(map(len, keywords))
+            self.automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                self.automaton.add_word(keyword.lower(), len(keyword))
+            self.automaton.make_automaton()
+
+    def find(self, text: str, lowered: str = None) -> Optional[str]:
+        """Return the leftmost keyword occurrence as written in text."""
+        if lowered is None:
+            lowered = text.lower()
+        # Offsets only carry over if lowercasing kept the length
+        if self.automaton is None or len(lowered) != len(text):
+            match = self.pattern.search(text)
+            return match.group(0) if match else None
+
+        best = None
+        for end, length in self.automaton.iter(lowered):
+            if best is not None and end - self.max_len >= best[0]:
+                break  # Matches come in end order; none can start earlier now
+            start = end - length + 1
+            if best is None or start < best[0]:
+                best = (start, end)
+        if best is None:
+            return None
+        return text[best[0]:best[1] + 1]
+
+
+# Patterns for parsing Gemini responses, compiled once at import. The
+# *_WORDS tuples hold words every pattern in a group needs, so a response
+# mentioning none of them skips that group's regexes.
+
+# Company data
+_EMP_PATTERNS = _compile_all(
+    r'(\d{1,3}(?:,\d{3})*)\s*(?:employees|staff|workers)',
+    r'employs?\s*(?:about|approximately|around|over|more than)?\s*(\d{1,3}(?:,\d{3})*)',
+    r'workforce\s*of\s*(?:about|approximately|around|over)?\s*(\d{1,3}(?:,\d{3})*)',
+    r'(\d{1,3}(?:,\d{3})*)\s*people\s*(?:work|employed)',
+)
+_EMP_WORDS = ("employ", "staff", "work", "people")
+# Upper bound of each employee range; counts above the last are "5000+"
+_EMP_BUCKETS = (10, 50, 200, 500, 1000, 5000)
+_EMP_LABELS = ("1-10", "11-50", "51-200", "201-500", "501-1000", "1001-5000", "5000+")
+_HQ_PATTERNS = _compile_all(
+    r'headquartered\s+in\s+([^,.]+(?:,\s*[A-Z][a-z]+)?)',
+    r'based\s+in\s+([^,.]+(?:,\s*[A-Z][a-z]+)?)',
+    r'headquarters?\s+(?:is|are|located)?\s*(?:in|at)?\s*([^,.]+(?:,\s*[A-Z][a-z]+)?)',
+)
+_HQ_WORDS = ("headquarter", "based")
+_HQ_CITIES = _KeywordSet(
+    "San Francisco", "New York", "Palo Alto", "Mountain View", "Austin",
+    "Boston", "Seattle", "Los Angeles", "London", "Berlin"
+)
+_YEAR_PATTERNS = _compile_all(
+    r'founded\s+(?:in\s+)?(\d{4})',
+    r'established\s+(?:in\s+)?(\d{4})',
+    r'started\s+(?:in\s+)?(\d{4})',
+    r'since\s+(\d{4})',
+)
+_YEAR_WORDS = ("founded", "established", "started", "since")
+_FUNDING_PATTERNS = _compile_all(
+    r'raised\s+\$?([\d.]+)\s*(billion|million|B|M)',
+    r'\$?([\d.]+)\s*(billion|million|B|M)\s+(?:in\s+)?(?:funding|investment|raised)',
+    r'funding\s+(?:of|totaling)\s+\$?([\d.]+)\s*(billion|million|B|M)',
+    r'series\s+[A-Z]\s+(?:of|at|worth)?\s*\$?([\d.]+)\s*(billion|million|B|M)',
+)
+_FUNDING_WORDS = ("raised", "funding", "investment", "series")
+_ROUND_PATTERNS = _compile_all(
+    r'(series\s+[A-Z](?:\d)?)',
+    r'(seed\s+(?:round|funding))',
+    r'(pre-seed)',
+    r'(IPO)',
+)
+_ROUND_WORDS = ("series", "seed", "ipo")
+_INDUSTRY_RE = re.compile(
+    r'(?:in the|specializes in|focuses on)\s+([a-z]+(?:\s+[a-z]+)?)\s+(?:industry|sector|space|market)',
+    re.IGNORECASE
+)
+_INDUSTRY_KEYWORDS = _KeywordSet(
+    "artificial intelligence", "machine learning", "AI", "ML", "fintech", "healthtech",
+    "biotech", "edtech", "cybersecurity", "cloud computing", "SaaS", "e-commerce", "robotics"
+)
+_STARTUP_RE = re.compile(r'startup|start-up', re.IGNORECASE)
+_PUBLIC_RE = re.compile(r'publicly\s+traded|NYSE|NASDAQ|public\s+company', re.IGNORECASE)
+_PRIVATE_RE = re.compile(r'private\s+company|privately\s+held', re.IGNORECASE)
+_WEBSITE_PATTERNS = _compile_all(
+    r'(https?://(?:www\.)?[a-z0-9-]+\.[a-z]{2,}(?:/[^\s]*)?)',
+    r'(?:website|site):\s*((?:www\.)?[a-z0-9-]+\.[a-z]{2,})',
+)
+_WEBSITE_WORDS = ("http", "site")
+# Legal suffixes dropped from company names for URLs, checked in this order
+_COMPANY_SUFFIXES = (" Inc", " Inc.", " Corp", " Corp.", " LLC", " Ltd", " Ltd.")
+_URL_UNSAFE_RE = re.compile(r"[^a-z0-9\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Search answers are capped at maxOutputTokens=2000, so this only bounds
+# the regex work on an unexpectedly long response
+MAX_PARSE_CHARS = 8192
+
+_DOMAIN_RE = re.compile(r'(?:https?://)?(?:www\.)?([a-z0-9-]+\.[a-z]{2,})')
+
+# Person data
+_TITLE_KEYWORDS = _KeywordSet(
+    "CEO", "CTO", "CFO", "COO", "CMO", "CPO", "VP", "President", "Director", "Founder", "Co-Founder"
+)
+_SERVES_AS_RE = re.compile(r'serves?\s+as\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE)
+# Every executive keyword, one named group per level. The lookahead makes
+# matches zero-width so keywords inside other keywords are still seen.
+_EXEC_LEVEL_RE = re.compile(
+    r'(?=(?P<clevel>CEO|CTO|CFO|COO|CMO|CPO|Chief)'
+    r'|(?P<founder>Founder|Co-Founder)'
+    r'|(?P<vp>VP|Vice President)'
+    r'|(?P<director>Director)'
+    r'|(?P<other>C-level|President))',
+    re.IGNORECASE
+)
+_EXEC_WORDS = (
+    "ceo", "cto", "cfo", "coo", "cmo", "cpo", "chief", "founder",
+    "vp", "vice president", "director", "c-level", "president"
+)
+# Groups that mark a person as an executive, and level names by precedence
+_EXEC_GROUPS = frozenset(("clevel", "founder", "other"))
+_EXEC_LEVELS = (("clevel", "C-level"), ("founder", "Founder"), ("vp", "VP"), ("director", "Director"))
+
+# KG predicates that make a person an executive, in precedence order,
+# with the (executive_level, current_title) each implies
+EXEC_PREDICATES = {
+    "CEO_OF": ("C-level", "CEO"),
+    "CTO_OF": ("C-level", "CTO"),
+    "CFO_OF": ("C-level", "CFO"),
+    "FOUNDED": ("Founder", "Founder"),
+}
+_COMPANY_PATTERNS = _compile_all(
+    r'(?:CEO|CTO|CFO|COO|founder)\s+(?:of|at)\s+([A-Z][A-Za-z0-9\s]+?)(?:\.|,)',
+    r'joined\s+([A-Z][A-Za-z0-9\s]+?)(?:\s+in|\s+as|\.)',
+)
+_COMPANY_TAIL_RE = re.compile(r'\s+(?:in|as|where|and).*$', re.IGNORECASE)
+_PERSON_LOCATION_PATTERNS = _compile_all(
+    r'based\s+in\s+([^,.]+)',
+    r'lives?\s+in\s+([^,.]+)',
+    r'from\s+([A-Z][a-z]+(?:,\s*[A-Z][a-z]+)?)',
+)
+_PREV_COMPANY_PATTERNS = _compile_all(
+    r'(?:previously|formerly|earlier)\s+(?:at|with|worked\s+(?:at|for))\s+([A-Z][A-Za-z0-9\s,]+?)(?:\.|;|and\s+(?:later|before))',
+    r'(?:ex-|former\s+)[A-Za-z]+\s+(?:at|of)\s+([A-Z][A-Za-z0-9]+)',
+)
+_PREV_COMPANY_WORDS = ("previously", "former", "earlier", "ex-")
+_EDU_PATTERNS = _compile_all(
+    r'(?:graduated|studied|degree)\s+(?:from|at)\s+([A-Z][A-Za-z\s]+(?:University|College|Institute|School))',
+    r'(Stanford|MIT|Harvard|Berkeley|Yale|Princeton|Cornell|Caltech|Carnegie\s+Mellon|Columbia)',
+)
+_EDU_WORDS = (
+    "graduated", "studied", "degree", "stanford", "mit", "harvard", "berkeley",
+    "yale", "princeton", "cornell", "caltech", "carnegie", "columbia"
+)
+_SKILL_PATTERNS = _compile_all(
+    r'expertise\s+in\s+([^,.]+)',
+    r'specializes?\s+in\s+([^,.]+)',
+    r'known\s+for\s+([^,.]+)',
+)
+_SKILL_WORDS = ("expertise", "speciali", "known")
+
+
+# Patterns that embed the entity name, compiled once per name. Sized so a
+# bulk run over every company/person in the KG keeps its names cached.
+_NAME_PATTERN_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=_NAME_PATTERN_CACHE_SIZE)
+def _company_desc_re(company_name: str) -> re.Pattern:
+    return re.compile(rf'{re.escape(company_name)}[^.]*\s+is\s+([^.]+\.)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=_NAME_PATTERN_CACHE_SIZE)
+def _person_title_re(person_name: str) -> re.Pattern:
+    return re.compile(
+        rf'{re.escape(person_name)}\s*(?:is|,)\s*(?:the\s+)?(?:current\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+(?:Officer|Executive|Director|Manager|Engineer|Scientist))?)',
+        re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=_NAME_PATTERN_CACHE_SIZE)
+def _person_company_re(person_name: str) -> re.Pattern:
+    return re.compile(
+        rf'{re.escape(person_name)}\s+(?:is|works)\s+(?:at|for|with)\s+([A-Z][A-Za-z0-9\s]+?)(?:\.|,|as)',
+        re.IGNORECASE
+    )
+
+
+# One connection pool per event loop, shared by every EnrichmentService on
+# it. The worker builds a service per job on one long-lived loop, so warm
+# TLS connections to the Gemini host carry over between jobs.
+_connectors = weakref.WeakKeyDictionary()
+
+
+def _shared_connector() -> aiohttp.TCPConnector:
+    """Get or create the running loop's shared TCP connector."""
+    loop = asyncio.get_running_loop()
+    connector = _connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            keepalive_timeout=75,
+            ttl_dns_cache=300
+        )
+        _connectors[loop] = connector
+    return connector
+
+
+async def close_shared_connector():
+    """Close the running loop's shared connector, e.g. at worker shutdown."""
+    connector = _connectors.pop(asyncio.get_running_loop(), None)
+    if connector is not None:
+        await connector.close()
+
 
 class EnrichmentService:
     """Service for enriching entities with external data via web search."""
@@ -25,11 +288,20 @@ class EnrichmentService:
     def __init__(self, kg: KnowledgeGraph = None):
         self.kg = kg or KnowledgeGraph()
         self._session = None
+        # Bound once so log calls skip the lazy proxy's configuration lookup
+        self.logger = logger.bind(component="enrichment")
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+        """Get or create HTTP session.
+
+        Every request goes to the Gemini host, so the session uses the
+        loop's shared connector, which keeps connections alive and caches
+        DNS across batches and services.
+        """
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
+                connector=_shared_connector(),
+                connector_owner=False,
                 timeout=aiohttp.ClientTimeout(total=60),
                 headers={
                     "Content-Type": "application/json"
@@ -38,42 +310,34 @@ class EnrichmentService:
         return self._session
 
     async def close(self):
-        """Close HTTP session."""
+        """Close HTTP session; the shared connector stays open for reuse."""
         if self._session and not self._session.closed:
             await self._session.close()
 
     async def _search_with_gemini(self, query: str) -> Optional[str]:
         """Use Gemini with Google Search grounding to get real-time data."""
         if not settings.gemini_api_key:
-            logger.warning("no_gemini_api_key", msg="Cannot perform web search without API key")
+            self.logger.warning("no_gemini_api_key", msg="Cannot perform web search without API key")
             return None
 
         session = await self._get_session()
 
-        payload = {
-            "contents": [{
-                "parts": [{
-                    "text": query
-                }]
-            }],
-            "tools": [{
-                "google_search": {}
-            }],
-            "generationConfig": {
-                "temperature": 0.1,
-                "maxOutputTokens": 2000
-            }
-        }
+        # Only the contents differ per query; the rest is shared, never mutated
+        payload = {**GEMINI_SEARCH_PAYLOAD, "contents": [{"parts": [{"text": query}]}]}
+
+        # Encode the body ourselves; the session already sends application/json
+        body = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode()
 
         try:
             url = f"{GEMINI_API_URL}?key={settings.gemini_api_key}"
-            async with session.post(url, json=payload) as resp:
+            async with session.post(url, data=body) as resp:
                 if resp.status != 200:
                     error_text = await resp.text()
-                    logger.error("gemini_search_failed", status=resp.status, error=error_text[:200])
+                    self.logger.error("gemini_search_failed", status=resp.status, error=error_text[:200])
                     return None
 
-                data = await resp.json()
+                raw = await resp.read()
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 candidates = data.get("candidates", [])
                 if candidates:
                     content = candidates[0].get("content", {})
@@ -81,7 +345,7 @@ class EnrichmentService:
                     if parts:
                         return parts[0].get("text", "")
         except Exception as e:
-            logger.error("gemini_search_error", error=str(e))
+            self.logger.error("gemini_search_error", error=str(e))
             return None
 
         return None
@@ -89,74 +353,51 @@ class EnrichmentService:
     def _parse_company_data(self, text: str, company_name: str) -> dict:
         """Parse company data from Gemini response."""
         data = {}
+        if not text or text.isspace():
+            return data
+        text = text[:MAX_PARSE_CHARS]
+        text_lower = text.lower()
 
         # Extract description (first sentence or two about the company)
-        desc_match = re.search(rf'{re.escape(company_name)}[^.]*\s+is\s+([^.]+\.)', text, re.IGNORECASE)
+        desc_match = _company_desc_re(company_name).search(text)
         if desc_match:
             data["description"] = f"{company_name} is {desc_match.group(1)}"
-        elif company_name.lower() in text.lower():
+        else:
             # Get text around company name
-            idx = text.lower().find(company_name.lower())
-            snippet = text[idx:idx+300].split('.')[0] + '.'
-            if len(snippet) > 30:
-                data["description"] = snippet
+            idx = text_lower.find(company_name.lower())
+            if idx >= 0:
+                snippet = text[idx:idx+300].split('.')[0] + '.'
+                if len(snippet) > 30:
+                    data["description"] = snippet
 
         # Extract employee count
-        emp_patterns = [
-            r'(\d{1,3}(?:,\d{3})*)\s*(?:employees|staff|workers)',
-            r'employs?\s*(?:about|approximately|around|over|more than)?\s*(\d{1,3}(?:,\d{3})*)',
-            r'workforce\s*of\s*(?:about|approximately|around|over)?\s*(\d{1,3}(?:,\d{3})*)',
-            r'(\d{1,3}(?:,\d{3})*)\s*people\s*(?:work|employed)',
-        ]
-        for pattern in emp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _EMP_PATTERNS if _mentions(text_lower, _EMP_WORDS) else ():
+            match = pattern.search(text)
             if match:
                 emp_str = match.group(1).replace(',', '')
                 try:
                     data["employee_count"] = int(emp_str)
-                    if data["employee_count"] <= 10:
-                        data["employee_range"] = "1-10"
-                    elif data["employee_count"] <= 50:
-                        data["employee_range"] = "11-50"
-                    elif data["employee_count"] <= 200:
-                        data["employee_range"] = "51-200"
-                    elif data["employee_count"] <= 500:
-                        data["employee_range"] = "201-500"
-                    elif data["employee_count"] <= 1000:
-                        data["employee_range"] = "501-1000"
-                    elif data["employee_count"] <= 5000:
-                        data["employee_range"] = "1001-5000"
-                    else:
-                        data["employee_range"] = "5000+"
+                    data["employee_range"] = _EMP_LABELS[
+                        bisect.bisect_left(_EMP_BUCKETS, data["employee_count"])
+                    ]
                     break
                 except ValueError:
                     pass
 
         # Extract headquarters/location
-        location_patterns = [
-            r'headquartered\s+in\s+([^,.]+(?:,\s*[A-Z][a-z]+)?)',
-            r'based\s+in\s+([^,.]+(?:,\s*[A-Z][a-z]+)?)',
-            r'headquarters?\s+(?:is|are|located)?\s*(?:in|at)?\s*([^,.]+(?:,\s*[A-Z][a-z]+)?)',
-            r'(?:San Francisco|New York|Palo Alto|Mountain View|Austin|Boston|Seattle|Los Angeles|London|Berlin)',
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _HQ_PATTERNS if _mentions(text_lower, _HQ_WORDS) else ():
+            match = pattern.search(text)
             if match:
-                if match.groups():
-                    data["headquarters"] = match.group(1).strip()
-                else:
-                    data["headquarters"] = match.group(0).strip()
+                data["headquarters"] = match.group(1).strip()
                 break
+        else:
+            city = _HQ_CITIES.find(text, text_lower)
+            if city:
+                data["headquarters"] = city
 
         # Extract founding year
-        year_patterns = [
-            r'founded\s+(?:in\s+)?(\d{4})',
-            r'established\s+(?:in\s+)?(\d{4})',
-            r'started\s+(?:in\s+)?(\d{4})',
-            r'since\s+(\d{4})',
-        ]
-        for pattern in year_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _YEAR_PATTERNS if _mentions(text_lower, _YEAR_WORDS) else ():
+            match = pattern.search(text)
             if match:
                 year = int(match.group(1))
                 if 1900 <= year <= 2026:
@@ -164,14 +405,8 @@ class EnrichmentService:
                     break
 
         # Extract funding information
-        funding_patterns = [
-            r'raised\s+\$?([\d.]+)\s*(billion|million|B|M)',
-            r'\$?([\d.]+)\s*(billion|million|B|M)\s+(?:in\s+)?(?:funding|investment|raised)',
-            r'funding\s+(?:of|totaling)\s+\$?([\d.]+)\s*(billion|million|B|M)',
-            r'series\s+[A-Z]\s+(?:of|at|worth)?\s*\$?([\d.]+)\s*(billion|million|B|M)',
-        ]
-        for pattern in funding_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _FUNDING_PATTERNS if _mentions(text_lower, _FUNDING_WORDS) else ():
+            match = pattern.search(text)
             if match:
                 amount = float(match.group(1))
                 unit = match.group(2).lower()
@@ -185,44 +420,29 @@ class EnrichmentService:
                 break
 
         # Extract funding round type
-        round_patterns = [
-            r'(series\s+[A-Z](?:\d)?)',
-            r'(seed\s+(?:round|funding))',
-            r'(pre-seed)',
-            r'(IPO)',
-        ]
-        for pattern in round_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ROUND_PATTERNS if _mentions(text_lower, _ROUND_WORDS) else ():
+            match = pattern.search(text)
             if match:
                 data["last_funding_type"] = match.group(1).title()
                 break
 
         # Extract industry
-        industry_patterns = [
-            r'(?:in the|specializes in|focuses on)\s+([a-z]+(?:\s+[a-z]+)?)\s+(?:industry|sector|space|market)',
-            r'(artificial intelligence|machine learning|AI|ML|fintech|healthtech|biotech|edtech|cybersecurity|cloud computing|SaaS|e-commerce|robotics)',
-        ]
-        for pattern in industry_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                data["industry"] = match.group(1).strip().title()
-                break
+        match = _INDUSTRY_RE.search(text)
+        industry = match.group(1) if match else _INDUSTRY_KEYWORDS.find(text, text_lower)
+        if industry:
+            data["industry"] = industry.strip().title()
 
         # Extract company type
-        if re.search(r'startup|start-up', text, re.IGNORECASE):
+        if _STARTUP_RE.search(text):
             data["company_type"] = "startup"
-        elif re.search(r'publicly\s+traded|NYSE|NASDAQ|public\s+company', text, re.IGNORECASE):
+        elif _PUBLIC_RE.search(text):
             data["company_type"] = "public"
-        elif re.search(r'private\s+company|privately\s+held', text, re.IGNORECASE):
+        elif _PRIVATE_RE.search(text):
             data["company_type"] = "private"
 
         # Extract website
-        website_patterns = [
-            r'(https?://(?:www\.)?[a-z0-9-]+\.[a-z]{2,}(?:/[^\s]*)?)',
-            r'(?:website|site):\s*((?:www\.)?[a-z0-9-]+\.[a-z]{2,})',
-        ]
-        for pattern in website_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _WEBSITE_PATTERNS if _mentions(text_lower, _WEBSITE_WORDS) else ():
+            match = pattern.search(text)
             if match:
                 url = match.group(1)
                 if not url.startswith('http'):
@@ -230,7 +450,7 @@ class EnrichmentService:
                 if 'linkedin' not in url and 'crunchbase' not in url and 'wikipedia' not in url:
                     data["website_url"] = url
                     # Extract domain
-                    domain_match = re.search(r'(?:https?://)?(?:www\.)?([a-z0-9-]+\.[a-z]{2,})', url)
+                    domain_match = _DOMAIN_RE.search(url)
                     if domain_match:
                         data["domain"] = domain_match.group(1)
                     break
@@ -240,100 +460,77 @@ class EnrichmentService:
     def _parse_person_data(self, text: str, person_name: str) -> dict:
         """Parse person data from Gemini response."""
         data = {}
+        if not text or text.isspace():
+            return data
+        text = text[:MAX_PARSE_CHARS]
+        text_lower = text.lower()
 
         # Extract current title
-        title_patterns = [
-            rf'{re.escape(person_name)}\s*(?:is|,)\s*(?:the\s+)?(?:current\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+(?:Officer|Executive|Director|Manager|Engineer|Scientist))?)',
-            r'(?:CEO|CTO|CFO|COO|CMO|CPO|VP|President|Director|Founder|Co-Founder)',
-            r'serves?\s+as\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-        ]
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                if match.groups():
-                    data["current_title"] = match.group(1).strip()
-                else:
-                    data["current_title"] = match.group(0).strip()
-                break
+        match = _person_title_re(person_name).search(text)
+        title = match.group(1) if match else _TITLE_KEYWORDS.find(text, text_lower)
+        if title is None:
+            match = _SERVES_AS_RE.search(text)
+            title = match.group(1) if match else None
+        if title is not None:
+            data["current_title"] = title.strip()
 
         # Check if executive
-        if re.search(r'CEO|CTO|CFO|COO|CMO|CPO|Chief|C-level|President|Founder|Co-Founder', text, re.IGNORECASE):
+        found = set()
+        for match in _EXEC_LEVEL_RE.finditer(text) if _mentions(text_lower, _EXEC_WORDS) else ():
+            found.add(match.lastgroup)
+            if match.lastgroup == "clevel":
+                break  # Highest level; nothing later can change the result
+        if found & _EXEC_GROUPS:
             data["is_executive"] = True
-            if re.search(r'CEO|CTO|CFO|COO|CMO|CPO|Chief', text, re.IGNORECASE):
-                data["executive_level"] = "C-level"
-            elif re.search(r'Founder|Co-Founder', text, re.IGNORECASE):
-                data["executive_level"] = "Founder"
-            elif re.search(r'VP|Vice President', text, re.IGNORECASE):
-                data["executive_level"] = "VP"
-            elif re.search(r'Director', text, re.IGNORECASE):
-                data["executive_level"] = "Director"
+            for group, level in _EXEC_LEVELS:
+                if group in found:
+                    data["executive_level"] = level
+                    break
 
         # Extract current company
-        company_patterns = [
-            rf'{re.escape(person_name)}\s+(?:is|works)\s+(?:at|for|with)\s+([A-Z][A-Za-z0-9\s]+?)(?:\.|,|as)',
-            r'(?:CEO|CTO|CFO|COO|founder)\s+(?:of|at)\s+([A-Z][A-Za-z0-9\s]+?)(?:\.|,)',
-            r'joined\s+([A-Z][A-Za-z0-9\s]+?)(?:\s+in|\s+as|\.)',
-        ]
+        company_patterns = (_person_company_re(person_name),) + _COMPANY_PATTERNS
         for pattern in company_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 company = match.group(1).strip()
                 # Clean up company name
-                company = re.sub(r'\s+(?:in|as|where|and).*$', '', company, flags=re.IGNORECASE)
+                company = _COMPANY_TAIL_RE.sub('', company)
                 if len(company) > 2 and len(company) < 50:
                     data["current_company"] = company
                     break
 
         # Extract location
-        location_patterns = [
-            r'based\s+in\s+([^,.]+)',
-            r'lives?\s+in\s+([^,.]+)',
-            r'from\s+([A-Z][a-z]+(?:,\s*[A-Z][a-z]+)?)',
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PERSON_LOCATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 data["location"] = match.group(1).strip()
                 break
 
         # Extract previous companies
-        prev_company_patterns = [
-            r'(?:previously|formerly|earlier)\s+(?:at|with|worked\s+(?:at|for))\s+([A-Z][A-Za-z0-9\s,]+?)(?:\.|;|and\s+(?:later|before))',
-            r'(?:ex-|former\s+)[A-Za-z]+\s+(?:at|of)\s+([A-Z][A-Za-z0-9]+)',
-        ]
         previous_companies = []
-        for pattern in prev_company_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _PREV_COMPANY_PATTERNS if _mentions(text_lower, _PREV_COMPANY_WORDS) else ():
+            matches = pattern.findall(text)
             for match in matches:
                 companies = [c.strip() for c in match.split(',')]
                 previous_companies.extend(companies)
         if previous_companies:
-            data["previous_companies"] = list(set(previous_companies))[:5]
+            data["previous_companies"] = list(dict.fromkeys(previous_companies))[:5]
 
         # Extract education
-        edu_patterns = [
-            r'(?:graduated|studied|degree)\s+(?:from|at)\s+([A-Z][A-Za-z\s]+(?:University|College|Institute|School))',
-            r'(Stanford|MIT|Harvard|Berkeley|Yale|Princeton|Cornell|Caltech|Carnegie\s+Mellon|Columbia)',
-        ]
         education = []
-        for pattern in edu_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _EDU_PATTERNS if _mentions(text_lower, _EDU_WORDS) else ():
+            matches = pattern.findall(text)
             education.extend(matches)
         if education:
-            data["education"] = list(set(education))[:3]
+            data["education"] = list(dict.fromkeys(education))[:3]
 
         # Extract skills/expertise
-        skill_patterns = [
-            r'expertise\s+in\s+([^,.]+)',
-            r'specializes?\s+in\s+([^,.]+)',
-            r'known\s+for\s+([^,.]+)',
-        ]
         skills = []
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _SKILL_PATTERNS if _mentions(text_lower, _SKILL_WORDS) else ():
+            matches = pattern.findall(text)
             skills.extend(matches)
         if skills:
-            data["skills"] = list(set(skills))[:5]
+            data["skills"] = list(dict.fromkeys(skills))[:5]
 
         return data
 
@@ -349,7 +546,7 @@ class EnrichmentService:
             )
 
         company_name = entity.name
-        logger.info("enriching_company_with_search", company=company_name)
+        self.logger.info("enriching_company_with_search", company=company_name)
 
         # Build search query for company info
         search_query = f"""Find detailed information about {company_name} company including:
@@ -398,15 +595,15 @@ Provide factual, current information with specific numbers where available."""
             enrichment.website_url = f"https://{enrichment.domain}"
 
         # Supplement with KG data
-        funding_rels = self.kg.query(subject=company_name, predicate="FUNDED_BY", limit=20)
+        company_rels = self.kg.query_many(["FUNDED_BY", "ACQUIRED"], subject=company_name, limit=20)
+        funding_rels = company_rels["FUNDED_BY"]
         if funding_rels:
             enrichment.funding_rounds = max(enrichment.funding_rounds, len(funding_rels))
-            kg_investors = list(set(r.object.name for r in funding_rels))
+            kg_investors = list(dict.fromkeys(r.object.name for r in funding_rels))
             if kg_investors:
                 enrichment.investors = kg_investors
 
-        acq_rels = self.kg.query(subject=company_name, predicate="ACQUIRED", limit=10)
-        if acq_rels and not enrichment.company_type:
+        if company_rels["ACQUIRED"] and not enrichment.company_type:
             enrichment.company_type = "acquirer"
 
         hire_rels = self.kg.query(obj=company_name, predicate="HIRED_BY", limit=20)
@@ -416,15 +613,17 @@ Provide factual, current information with specific numbers where available."""
 
         # Store enrichment
         source = "web_search" if search_result else "internal"
-        self.kg.add_enrichment(entity_id, source, enrichment.to_dict())
+        # Store only the fields that were found; readers fill in defaults
+        self.kg.add_enrichment(entity_id, source, enrichment.to_sparse_dict())
+        data = enrichment.to_dict()
 
-        logger.info("company_enriched", entity_id=entity_id, company=company_name, source=source)
+        self.logger.info("company_enriched", entity_id=entity_id, company=company_name, source=source)
 
         return EnrichmentResult(
             success=True,
             source=source,
             entity_type="company",
-            data=enrichment.to_dict()
+            data=data
         )
 
     async def enrich_person_with_search(self, entity_id: int) -> EnrichmentResult:
@@ -439,19 +638,23 @@ Provide factual, current information with specific numbers where available."""
             )
 
         person_name = entity.name
-        logger.info("enriching_person_with_search", person=person_name)
+        self.logger.info("enriching_person_with_search", person=person_name)
 
         # Get context from KG to make search more specific
         context_parts = []
-        hire_rels = self.kg.query(subject=person_name, predicate="HIRED_BY", limit=5)
+        # Everything the KG supplement below needs, fetched in one query
+        person_rels = self.kg.query_many(
+            ["HIRED_BY", *EXEC_PREDICATES, "DEPARTED_FROM"], subject=person_name, limit=20
+        )
+        hire_rels = person_rels["HIRED_BY"]
         if hire_rels:
             context_parts.append(f"at {hire_rels[0].object.name}")
 
-        exec_rels = self.kg.query(subject=person_name, limit=20)
-        for rel in exec_rels:
-            if rel.predicate in ['CEO_OF', 'CTO_OF', 'CFO_OF', 'FOUNDED']:
-                context_parts.append(f"{rel.predicate.replace('_', ' ').lower()} {rel.object.name}")
-                break
+        # The most recent exec role, ranked as query() orders (newest date, then id)
+        exec_rels = [rels[0] for rels in map(person_rels.get, EXEC_PREDICATES) if rels]
+        if exec_rels:
+            rel = max(exec_rels, key=lambda r: (r.event_date is not None, r.event_date or date.min, r.id))
+            context_parts.append(f"{rel.predicate.replace('_', ' ').lower()} {rel.object.name}")
 
         context = " ".join(context_parts)
 
@@ -489,48 +692,69 @@ Provide factual information about this professional."""
         enrichment.linkedin_url = f"https://www.linkedin.com/search/results/people/?keywords={clean_name}"
 
         # Supplement with KG data
-        hire_rels = self.kg.query(subject=person_name, predicate="HIRED_BY", limit=20)
         if hire_rels:
             if not enrichment.current_company:
                 enrichment.current_company = hire_rels[0].object.name
-            kg_prev = list(set(r.object.name for r in hire_rels[1:]))
-            enrichment.previous_companies = list(set(enrichment.previous_companies + kg_prev))
+            kg_prev = [r.object.name for r in hire_rels[1:]]
+            enrichment.previous_companies = list(dict.fromkeys(enrichment.previous_companies + kg_prev))
 
-        exec_predicates = ["CEO_OF", "CTO_OF", "CFO_OF", "FOUNDED"]
-        for pred in exec_predicates:
-            exec_rels = self.kg.query(subject=person_name, predicate=pred, limit=5)
-            if exec_rels:
+        for pred, (level, title) in EXEC_PREDICATES.items():
+            if person_rels[pred]:
                 enrichment.is_executive = True
-                if pred == "CEO_OF" and not enrichment.current_title:
-                    enrichment.executive_level = "C-level"
-                    enrichment.current_title = "CEO"
-                elif pred == "CTO_OF" and not enrichment.current_title:
-                    enrichment.executive_level = "C-level"
-                    enrichment.current_title = "CTO"
-                elif pred == "CFO_OF" and not enrichment.current_title:
-                    enrichment.executive_level = "C-level"
-                    enrichment.current_title = "CFO"
-                elif pred == "FOUNDED" and not enrichment.current_title:
-                    enrichment.executive_level = "Founder"
-                    enrichment.current_title = "Founder"
+                if not enrichment.current_title:
+                    enrichment.executive_level = level
+                    enrichment.current_title = title
                 break
 
-        depart_rels = self.kg.query(subject=person_name, predicate="DEPARTED_FROM", limit=10)
+        depart_rels = person_rels["DEPARTED_FROM"][:10]
         if depart_rels:
             kg_depart = [r.object.name for r in depart_rels]
-            enrichment.previous_companies = list(set(enrichment.previous_companies + kg_depart))
+            enrichment.previous_companies = list(dict.fromkeys(enrichment.previous_companies + kg_depart))
 
         # Store enrichment
         source = "web_search" if search_result else "internal"
-        self.kg.add_enrichment(entity_id, source, enrichment.to_dict())
+        # Store only the fields that were found; readers fill in defaults
+        self.kg.add_enrichment(entity_id, source, enrichment.to_sparse_dict())
+        data = enrichment.to_dict()
 
-        logger.info("person_enriched", entity_id=entity_id, person=person_name, source=source)
+        self.logger.info("person_enriched", entity_id=entity_id, person=person_name, source=source)
 
         return EnrichmentResult(
             success=True,
             source=source,
             entity_type="person",
-            data=enrichment.to_dict()
+            data=data
+        )
+
+    def _stored_enrichment(
+        self, entity_id: int, entity_type: str, max_age: timedelta
+    ) -> Optional[EnrichmentResult]:
+        """Return the stored web search enrichment if it is recent enough."""
+        stored = self.kg.get_enrichment(entity_id, "web_search")
+        enriched_at = stored.get("enriched_at")
+        # An internal fallback must not stand in for a real search
+        if not enriched_at or stored.get("source") != "web_search":
+            return None
+
+        # SQLite returns CURRENT_TIMESTAMP as a naive UTC string, Postgres a datetime
+        if isinstance(enriched_at, str):
+            enriched_at = datetime.fromisoformat(enriched_at)
+        if enriched_at.tzinfo is None:
+            enriched_at = enriched_at.replace(tzinfo=timezone.utc)
+        else:
+            enriched_at = enriched_at.astimezone(timezone.utc)
+        if datetime.now(timezone.utc) - enriched_at > max_age:
+            return None
+
+        # Stored data leaves out defaults; return the full schema, as a fresh run does
+        enrichment_class = CompanyEnrichment if entity_type == "company" else PersonEnrichment
+        self.logger.info("enrichment_cache_hit", entity_id=entity_id, entity_type=entity_type)
+        return EnrichmentResult(
+            success=True,
+            source="web_search",
+            entity_type=entity_type,
+            data=enrichment_class.from_dict(stored.get("data", {})).to_dict(),
+            enriched_at=enriched_at
         )
 
     # Alias old methods to new ones for backward compatibility
@@ -542,47 +766,65 @@ Provide factual information about this professional."""
         """Enrich a person entity with external data."""
         return await self.enrich_person_with_search(entity_id)
 
-    async def enrich_all_companies(self, limit: int = 100) -> List[EnrichmentResult]:
-        """Enrich all company entities."""
-        companies = self.kg.search_entities("", entity_type="company")
-        results = []
+    async def _enrich_many(self, entities, enrich, failure_event: str,
+                           concurrency: int, rate_delay: float) -> List[EnrichmentResult]:
+        """Run enrich over entities concurrently, bounded by a semaphore.
+
+        Entities enriched within settings.enrichment_cache_ttl_hours reuse
+        their stored result.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        max_age = timedelta(hours=settings.enrichment_cache_ttl_hours)
 
-        for company in companies[:limit]:
+        async def enrich_one(entity) -> Optional[EnrichmentResult]:
             try:
-                result = await self.enrich_company(company.id)
-                results.append(result)
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(0.5)
+                # Cache hits skip the search and the rate-limit delay
+                cached = self._stored_enrichment(entity.id, entity.entity_type, max_age)
+                if cached:
+                    return cached
+
+                async with semaphore:
+                    try:
+                        return await enrich(entity.id)
+                    finally:
+                        # Small delay to avoid rate limiting (per concurrent slot)
+                        await asyncio.sleep(rate_delay)
             except Exception as e:
-                logger.error("company_enrichment_failed", entity_id=company.id, error=str(e))
+                self.logger.error(failure_event, entity_id=entity.id, error=str(e))
+                return None
 
-        return results
+        results = await asyncio.gather(*(enrich_one(e) for e in entities))
+        return [r for r in results if r is not None]
+
+    async def enrich_all_companies(self, limit: int = 100, concurrency: int = 8,
+                                   rate_delay: float = 0.5) -> List[EnrichmentResult]:
+        """Enrich all company entities."""
+        companies = self.kg.search_entities("", entity_type="company")
+        return await self._enrich_many(
+            companies[:limit], self.enrich_company, "company_enrichment_failed",
+            concurrency, rate_delay
+        )
 
-    async def enrich_all_people(self, limit: int = 100) -> List[EnrichmentResult]:
+    async def enrich_all_people(self, limit: int = 100, concurrency: int = 8,
+                                rate_delay: float = 0.5) -> List[EnrichmentResult]:
         """Enrich all person entities."""
         people = self.kg.search_entities("", entity_type="person")
-        results = []
-
-        for person in people[:limit]:
-            try:
-                result = await self.enrich_person(person.id)
-                results.append(result)
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(0.5)
-            except Exception as e:
-                logger.error("person_enrichment_failed", entity_id=person.id, error=str(e))
-
-        return results
+        return await self._enrich_many(
+            people[:limit], self.enrich_person, "person_enrichment_failed",
+            concurrency, rate_delay
+        )
 
     def _clean_company_name(self, name: str) -> str:
         """Clean company name for URL generation."""
-        for suffix in [" Inc", " Inc.", " Corp", " Corp.", " LLC", " Ltd", " Ltd."]:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)]
+        # Most names have no suffix; one endswith() call rules them all out
+        if name.endswith(_COMPANY_SUFFIXES):
+            for suffix in _COMPANY_SUFFIXES:
+                if name.endswith(suffix):
+                    name = name[:-len(suffix)]
 
         clean = name.lower().strip()
-        clean = re.sub(r"[^a-z0-9\s-]", "", clean)
-        clean = re.sub(r"\s+", "-", clean)
+        clean = _URL_UNSAFE_RE.sub("", clean)
+        clean = _WHITESPACE_RE.sub("-", clean)
         return clean
 
     def _infer_domain(self, company_name: str) -> Optional[str]:
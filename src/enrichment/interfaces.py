@@ -1,11 +1,20 @@
 """Data models for entity enrichment."""
 
-from dataclasses import dataclass, field
-from typing import Optional, List
-from datetime import datetime
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, ClassVar, Dict, Optional, List, Tuple
+from datetime import datetime, timezone
+from functools import partial
 
 
-@dataclass
+def _field_defaults(cls) -> Dict[str, Any]:
+    """Each dataclass field's default value, calling default factories once."""
+    return {
+        f.name: f.default if f.default is not MISSING else f.default_factory()
+        for f in fields(cls)
+    }
+
+
+@dataclass(slots=True)
 class CompanyEnrichment:
     """Enriched company data from external sources."""
 
@@ -49,6 +58,10 @@ class CompanyEnrichment:
     recent_headcount_change: Optional[str] = None  # "+20%", "-10%"
     job_openings_count: Optional[int] = None
 
+    # Field names and defaults, filled in once the class exists (see below)
+    FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+    FIELD_DEFAULTS: ClassVar[Dict[str, Any]] = {}
+
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
         return {
@@ -80,13 +93,21 @@ class CompanyEnrichment:
             "job_openings_count": self.job_openings_count,
         }
 
+    def to_sparse_dict(self) -> dict:
+        """Convert to dictionary, leaving out fields still at their default."""
+        return {k: v for k, v in self.to_dict().items() if v != self.FIELD_DEFAULTS[k]}
+
     @classmethod
     def from_dict(cls, data: dict) -> "CompanyEnrichment":
         """Create from dictionary."""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        return cls(**{k: data[k] for k in cls.FIELD_NAMES if k in data})
+
 
+CompanyEnrichment.FIELD_NAMES = tuple(f.name for f in fields(CompanyEnrichment))
+CompanyEnrichment.FIELD_DEFAULTS = _field_defaults(CompanyEnrichment)
 
-@dataclass
+
+@dataclass(slots=True)
 class PersonEnrichment:
     """Enriched person data from external sources."""
 
@@ -115,6 +136,10 @@ class PersonEnrichment:
     twitter_url: Optional[str] = None
     github_url: Optional[str] = None
 
+    # Field names and defaults, filled in once the class exists (see below)
+    FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+    FIELD_DEFAULTS: ClassVar[Dict[str, Any]] = {}
+
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
         return {
@@ -133,13 +158,21 @@ class PersonEnrichment:
             "github_url": self.github_url,
         }
 
+    def to_sparse_dict(self) -> dict:
+        """Convert to dictionary, leaving out fields still at their default."""
+        return {k: v for k, v in self.to_dict().items() if v != self.FIELD_DEFAULTS[k]}
+
     @classmethod
     def from_dict(cls, data: dict) -> "PersonEnrichment":
         """Create from dictionary."""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        return cls(**{k: data[k] for k in cls.FIELD_NAMES if k in data})
+
+
+PersonEnrichment.FIELD_NAMES = tuple(f.name for f in fields(PersonEnrichment))
+PersonEnrichment.FIELD_DEFAULTS = _field_defaults(PersonEnrichment)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichmentResult:
     """Result of an enrichment attempt."""
 
@@ -148,4 +181,4 @@ class EnrichmentResult:
     entity_type: str  # "company" or "person"
     data: dict = field(default_factory=dict)
     error: Optional[str] = None
-    enriched_at: datetime = field(default_factory=datetime.utcnow)
+    enriched_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
@@ -5,7 +5,7 @@ from typing import List, Optional, Dict, Any
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """An extracted entity."""
     name: str
@@ -19,7 +19,7 @@ class Entity:
             self.normalized_name = self.name.lower().strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """A relationship between two entities."""
     subject: str           # Entity name
@@ -32,7 +32,7 @@ class Relationship:
     context: str = ""      # Supporting text
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """Result of extracting from an article."""
     entities: List[Entity]
@@ -1,13 +1,83 @@
 """LLM API client wrapper with provider abstraction."""
 
+import asyncio
+import sys
+import weakref
 from typing import Optional
+import httpx
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
+
+try:
+    from google.genai import types as genai_types
+    GENAI_AVAILABLE = True
+except ImportError:
+    GENAI_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - lets httpx speak HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 from ..config.settings import settings
 
 logger = structlog.get_logger()
 
+# One connection pool per SDK per event loop, shared by every LLMClient
+# using that SDK on that loop. Pools can't be used from another loop.
+_http_clients = weakref.WeakKeyDictionary()
+
+
+def _shared_http_client(sdk):
+    """Get or create the running loop's shared HTTP client for an SDK module.
+
+    Built with the SDK's own DefaultAsyncHttpxClient, which keeps its
+    default timeouts and limits; newer anthropic releases only accept
+    their own httpx fork, not a plain httpx.AsyncClient.
+    """
+    clients = _http_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(sdk.__name__)
+    if client is None or client.is_closed:
+        client = sdk.DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+        clients[sdk.__name__] = client
+    return client
+
+
+# Network failures and timeouts. Anything else without an HTTP status
+# (missing API key, TypeError, a malformed response) fails the same way
+# on every attempt, so isn't retried.
+_TRANSIENT_ERRORS = (httpx.TransportError, ConnectionError, TimeoutError, asyncio.TimeoutError)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether a failed LLM call is worth retrying."""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int):
+        return status in (408, 409, 429) or status >= 500
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return True
+    # SDK connection errors (incl. APITimeoutError); only an imported SDK can raise them
+    return any(
+        isinstance(error, sdk.APIConnectionError)
+        for sdk in map(sys.modules.get, ("anthropic", "openai"))
+        if sdk is not None
+    )
+
+
+_backoff = wait_exponential(multiplier=1, min=1, max=10) + wait_random(0, 0.5)
+
+
+def _retry_wait(retry_state) -> float:
+    """Back off exponentially with jitter, or longer if the API says so."""
+    wait = _backoff(retry_state)
+    response = getattr(retry_state.outcome.exception(), "response", None)
+    try:
+        retry_after = float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return wait
+    return max(wait, min(retry_after, 60))
+
 
 class LLMClient:
     """Unified LLM client supporting Gemini, Anthropic, and OpenAI."""
@@ -16,10 +86,12 @@ class LLMClient:
         self.provider = provider or settings.llm_provider
         self._api_key = api_key
         self._client = None
+        self._client_loop = None
 
     def _get_client(self):
-        """Lazy initialization of the client."""
-        if self._client is not None:
+        """Lazy initialization of the client, one per event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop() is loop:
             return self._client
 
         if self.provider == "gemini":
@@ -34,23 +106,27 @@ class LLMClient:
             api_key = self._api_key or settings.anthropic_api_key
             if not api_key:
                 raise ValueError("Anthropic API key not configured")
-            self._client = anthropic.AsyncAnthropic(api_key=api_key)
+            self._client = anthropic.AsyncAnthropic(api_key=api_key, http_client=_shared_http_client(anthropic))
 
         elif self.provider == "openai":
             import openai
             api_key = self._api_key or settings.openai_api_key
             if not api_key:
                 raise ValueError("OpenAI API key not configured")
-            self._client = openai.AsyncOpenAI(api_key=api_key)
+            self._client = openai.AsyncOpenAI(api_key=api_key, http_client=_shared_http_client(openai))
 
         else:
             raise ValueError(f"Unknown LLM provider: {self.provider}")
 
+        # The SDK client and its pool belong to this loop; rebuild on another
+        self._client_loop = weakref.ref(loop)
         return self._client
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10)
+        wait=_retry_wait,
+        retry=retry_if_exception(_is_transient),
+        reraise=True
     )
     async def complete(
         self,
@@ -78,28 +154,34 @@ class LLMClient:
 
     async def _complete_gemini(self, client, prompt: str, system: str, max_tokens: int, temperature: float) -> str:
         """Call Gemini API."""
-        from google.genai import types
-        import asyncio
-
         # Combine system prompt with user prompt
         full_prompt = prompt
         if system:
             full_prompt = f"{system}\n\n{prompt}"
 
-        # Gemini client is sync, run in executor
-        def _sync_call():
-            response = client.models.generate_content(
+        config = genai_types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+        )
+
+        # google-genai's async client awaits the request without a thread
+        aio = getattr(client, "aio", None)
+        if aio is not None:
+            response = await aio.models.generate_content(
                 model=settings.llm_model,
                 contents=full_prompt,
-                config=types.GenerateContentConfig(
-                    temperature=temperature,
-                    max_output_tokens=max_tokens,
-                ),
+                config=config,
             )
             return response.text
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _sync_call)
+        # SDKs without .aio are sync only, run in a worker thread
+        response = await asyncio.to_thread(
+            client.models.generate_content,
+            model=settings.llm_model,
+            contents=full_prompt,
+            config=config,
+        )
+        return response.text
 
     async def _complete_anthropic(self, client, prompt: str, system: str, max_tokens: int, temperature: float) -> str:
         """Call Anthropic API."""
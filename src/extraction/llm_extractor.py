@@ -2,13 +2,20 @@
 
 import json
 import asyncio
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Tuple
 from datetime import date
 from pathlib import Path
 
 import yaml
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .interfaces import (
     ExtractorInterface, ExtractionResult,
@@ -19,6 +26,10 @@ from ..config.settings import settings
 
 logger = structlog.get_logger()
 
+# Contents of the first markdown code block, preferring a ```json one
+_JSON_FENCE_RE = re.compile(r'```json(.*?)```', re.DOTALL)
+_FENCE_RE = re.compile(r'```(.*?)```', re.DOTALL)
+
 
 class LLMExtractor(ExtractorInterface):
     """LLM-powered entity and relationship extractor."""
@@ -85,6 +96,19 @@ ARTICLE TITLE: {title}
 ARTICLE CONTENT:
 {content}"""
 
+    # The template split once around its two fields, so extract() joins
+    # static pieces instead of re-parsing the template on every article
+    _PROMPT_HEAD, _PROMPT_MIDDLE, _PROMPT_TAIL = EXTRACTION_PROMPT.format(title="\0", content="\0").split("\0")
+    # Everything before the article, shared by single and multi-article prompts
+    _INSTRUCTIONS = _PROMPT_HEAD.rpartition("ARTICLE TITLE:")[0]
+
+    MULTI_ARTICLE_PROMPT = """The {count} articles below are numbered. Extract from each article independently, using only that article's text.
+Return ONLY a JSON array with exactly {count} objects, one per article in article order, each in the format above.
+"""
+
+    # Article content beyond this many characters isn't sent to the LLM
+    MAX_CONTENT_CHARS = 4000
+
     # Patterns that indicate bad entity extraction
     BAD_ENTITY_PATTERNS = [
         'says', 'said', 'announced', 'reported', 'according', 'stated',
@@ -95,15 +119,27 @@ ARTICLE CONTENT:
         'january', 'february', 'march', 'april', 'may', 'june',
         'july', 'august', 'september', 'october', 'november', 'december'
     ]
+    # All of the above as one alternation, so a name is scanned once.
+    # Whole words only: "may" rejects "May 2024" but not "Mayer".
+    BAD_ENTITY_RE = re.compile(r'\b(?:%s)\b' % '|'.join(map(re.escape, BAD_ENTITY_PATTERNS)))
 
     # Common company suffixes to normalize
     COMPANY_SUFFIXES = [
         ' Inc.', ' Inc', ' Corp.', ' Corp', ' LLC', ' Ltd.', ' Ltd',
         ' Corporation', ' Company', ' Co.', ' Co', ' PLC', ' LP', ' LLP'
     ]
+    # Any one of the above at the very end of a name. No suffix ends
+    # another, so at most one can match.
+    COMPANY_SUFFIX_RE = re.compile(r'(?:%s)\Z' % '|'.join(map(re.escape, COMPANY_SUFFIXES)))
+
+    # Entity names recur across articles; validation and normalization are
+    # pure, so repeats are answered from per-instance LRU caches
+    ENTITY_CACHE_SIZE = 16384
 
     def __init__(self, llm_client: LLMClient = None):
         self.llm_client = llm_client or LLMClient()
+        self._validate_entity_cached = lru_cache(maxsize=self.ENTITY_CACHE_SIZE)(self._validate_entity)
+        self._normalize_entity_name_cached = lru_cache(maxsize=self.ENTITY_CACHE_SIZE)(self._normalize_entity_name)
         self.system_prompt = """You are an expert at extracting structured business intelligence from news articles.
 
 CRITICAL RULES:
@@ -120,15 +156,12 @@ You extract data for a recruiting intelligence system that tracks:
 - Executive movements (available talent signals)
 - Layoffs (displaced talent signals)"""
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10)
-    )
     async def extract(self, title: str, content: str) -> ExtractionResult:
         """Extract entities and relationships using LLM."""
-        prompt = self.EXTRACTION_PROMPT.format(
-            title=title,
-            content=content[:4000]  # Limit content length
+        prompt = (
+            f"{self._PROMPT_HEAD}{title}"
+            f"{self._PROMPT_MIDDLE}{content[:self.MAX_CONTENT_CHARS]}"
+            f"{self._PROMPT_TAIL}"
         )
 
         try:
@@ -153,10 +186,10 @@ You extract data for a recruiting intelligence system that tracks:
             return False
 
         # Reject if contains bad patterns (sentence fragments)
-        for pattern in self.BAD_ENTITY_PATTERNS:
-            if pattern in name_lower:
-                logger.debug("entity_rejected_pattern", name=name, pattern=pattern)
-                return False
+        match = self.BAD_ENTITY_RE.search(name_lower)
+        if match:
+            logger.debug("entity_rejected_pattern", name=name, pattern=match.group(0))
+            return False
 
         # Reject single common words
         common_words = {'company', 'startup', 'firm', 'investor', 'ceo', 'cto', 'employee'}
@@ -178,27 +211,26 @@ You extract data for a recruiting intelligence system that tracks:
 
         # Remove company suffixes for cleaner matching
         if entity_type == 'company':
-            for suffix in self.COMPANY_SUFFIXES:
-                if name.endswith(suffix):
-                    name = name[:-len(suffix)].strip()
-                    break
+            name = self.COMPANY_SUFFIX_RE.sub('', name).rstrip()
 
         return name
 
+    @staticmethod
+    def _strip_code_fence(response: str) -> str:
+        """Return the contents of a markdown code block, if there is one."""
+        if '```' not in response:
+            return response
+        fence = _JSON_FENCE_RE if '```json' in response else _FENCE_RE
+        match = fence.search(response)
+        if match and match.group(1):
+            return match.group(1)
+        return response
+
     def _parse_response(self, response: str) -> ExtractionResult:
         """Parse LLM response into structured result."""
         try:
             # Handle markdown code blocks
-            if '```json' in response:
-                start = response.find('```json') + 7
-                end = response.find('```', start)
-                if end > start:
-                    response = response[start:end]
-            elif '```' in response:
-                start = response.find('```') + 3
-                end = response.find('```', start)
-                if end > start:
-                    response = response[start:end]
+            response = self._strip_code_fence(response)
 
             # Find JSON in response
             start = response.find('{')
@@ -206,107 +238,227 @@ You extract data for a recruiting intelligence system that tracks:
             if start < 0 or end <= start:
                 return ExtractionResult(entities=[], relationships=[])
 
-            data = json.loads(response[start:end])
+            # orjson's decode error subclasses json.JSONDecodeError
+            raw = response[start:end]
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            return self._build_result(data, response)
+
+        except json.JSONDecodeError:
+            logger.warning("json_parse_failed", response=response[:200])
+            return ExtractionResult(entities=[], relationships=[])
 
-            # Parse and validate entities
-            entities = []
-            for e in data.get("entities", []):
-                name = e.get("name", "")
-                entity_type = e.get("type", "unknown")
+    def _parse_multi_response(self, response: str, count: int) -> Optional[List[ExtractionResult]]:
+        """Parse a multi-article response, or None if it isn't one result per article."""
+        response = self._strip_code_fence(response)
 
-                if not self._validate_entity(name, entity_type):
-                    continue
+        start = response.find('[')
+        end = response.rfind(']') + 1
+        if start < 0 or end <= start:
+            return None
 
-                normalized_name = self._normalize_entity_name(name, entity_type)
-                entities.append(Entity(
-                    name=normalized_name,
-                    entity_type=entity_type,
-                    attributes={"role": e.get("role")} if e.get("role") else {},
-                    confidence=0.9
+        raw = response[start:end]
+        try:
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, list) or len(data) != count:
+            return None
+
+        return [
+            self._build_result(item, json.dumps(item))
+            if isinstance(item, dict)
+            else ExtractionResult(entities=[], relationships=[])
+            for item in data
+        ]
+
+    def _build_result(self, data: dict, raw_response: str) -> ExtractionResult:
+        """Validate and normalize one article's parsed extraction JSON."""
+        # Parse and validate entities
+        entities = []
+        for e in data.get("entities", []):
+            name = e.get("name", "")
+            entity_type = e.get("type", "unknown")
+
+            if not self._validate_entity_cached(name, entity_type):
+                continue
+
+            normalized_name = self._normalize_entity_name_cached(name, entity_type)
+            entities.append(Entity(
+                name=normalized_name,
+                entity_type=entity_type,
+                attributes={"role": e.get("role")} if e.get("role") else {},
+                confidence=0.9
+            ))
+
+        # Entity type by lowercased name; reversed so the first entity
+        # with a given name wins
+        type_by_name = {e.name.lower(): e.entity_type for e in reversed(entities)}
+
+        # Parse relationships
+        relationships = []
+        for r in data.get("relationships", []):
+            subject = r.get("subject", "")
+            predicate = r.get("predicate", "")
+            obj = r.get("object", "")
+            confidence = r.get("confidence", 0.8)
+
+            # Skip low confidence relationships
+            if confidence < 0.70:
+                continue
+
+            if subject and predicate and obj:
+                # Normalize names to match entities
+                subject_norm = self._normalize_entity_name_cached(subject, "unknown")
+                obj_norm = self._normalize_entity_name_cached(obj, "unknown")
+
+                relationships.append(Relationship(
+                    subject=subject_norm,
+                    subject_type=type_by_name.get(subject_norm.lower(), "unknown"),
+                    predicate=predicate,
+                    object=obj_norm,
+                    object_type=type_by_name.get(obj_norm.lower(), "unknown"),
+                    confidence=confidence,
+                    context=r.get("context", "")
                 ))
 
-            # Parse relationships (only if both entities are valid)
-            entity_names = {e.name.lower() for e in entities}
-            relationships = []
-            for r in data.get("relationships", []):
-                subject = r.get("subject", "")
-                predicate = r.get("predicate", "")
-                obj = r.get("object", "")
-                confidence = r.get("confidence", 0.8)
-
-                # Skip low confidence relationships
-                if confidence < 0.70:
-                    continue
-
-                if subject and predicate and obj:
-                    # Normalize names to match entities
-                    subject_norm = self._normalize_entity_name(subject, "unknown")
-                    obj_norm = self._normalize_entity_name(obj, "unknown")
-
-                    relationships.append(Relationship(
-                        subject=subject_norm,
-                        subject_type=self._get_entity_type(subject_norm, entities),
-                        predicate=predicate,
-                        object=obj_norm,
-                        object_type=self._get_entity_type(obj_norm, entities),
-                        confidence=confidence,
-                        context=r.get("context", "")
-                    ))
-
-            # Parse date
-            event_date = None
-            if data.get("event_date"):
-                try:
-                    event_date = date.fromisoformat(data["event_date"])
-                except ValueError:
-                    pass
-
-            logger.info(
-                "extraction_complete",
-                entities=len(entities),
-                relationships=len(relationships)
+        # Parse date
+        event_date = None
+        if data.get("event_date"):
+            try:
+                event_date = date.fromisoformat(data["event_date"])
+            except ValueError:
+                pass
+
+        logger.info(
+            "extraction_complete",
+            entities=len(entities),
+            relationships=len(relationships)
+        )
+
+        return ExtractionResult(
+            entities=entities,
+            relationships=relationships,
+            event_date=event_date,
+            amounts=data.get("amounts", {}),
+            raw_response=raw_response
+        )
+
+    async def extract_multi(self, articles: List[dict]) -> List[ExtractionResult]:
+        """Extract from several articles with a single LLM call.
+
+        The instructions are sent once for the whole group. Falls back to
+        one extract() per article if the call fails or the response
+        doesn't hold exactly one result per article.
+        """
+        parts = [self._INSTRUCTIONS, self.MULTI_ARTICLE_PROMPT.format(count=len(articles))]
+        for n, article in enumerate(articles, 1):
+            title, content = self._article_text(article)
+            parts.append(
+                f"\nARTICLE {n} TITLE: {title}\n\n"
+                f"ARTICLE {n} CONTENT:\n{content[:self.MAX_CONTENT_CHARS]}\n"
             )
 
-            return ExtractionResult(
-                entities=entities,
-                relationships=relationships,
-                event_date=event_date,
-                amounts=data.get("amounts", {}),
-                raw_response=response
+        results = None
+        try:
+            response = await self.llm_client.complete(
+                prompt="".join(parts),
+                system=self.system_prompt,
+                max_tokens=min(settings.llm_max_tokens * len(articles), settings.llm_max_output_tokens)
             )
+            results = self._parse_multi_response(response, len(articles))
+        except Exception as e:
+            logger.error("multi_extraction_failed", articles=len(articles), error=str(e))
+
+        if results is None:
+            logger.warning("multi_extraction_fallback", articles=len(articles))
+            results = [await self.extract(*self._article_text(a)) for a in articles]
+        return results
+
+    @staticmethod
+    def _article_text(article: dict) -> Tuple[str, str]:
+        """Title and body text of an article dict."""
+        return (
+            article.get("title", ""),
+            article.get("content", "") or article.get("summary", "")
+        )
 
-        except json.JSONDecodeError:
-            logger.warning("json_parse_failed", response=response[:200])
-            return ExtractionResult(entities=[], relationships=[])
+    async def _extract_group(
+        self,
+        group: List[dict],
+        semaphore: asyncio.Semaphore
+    ) -> List[ExtractionResult]:
+        """Extract one group of articles; an empty list if extraction raised."""
+        try:
+            async with semaphore:
+                if len(group) == 1:
+                    results = [await self.extract(*self._article_text(group[0]))]
+                else:
+                    results = await self.extract_multi(group)
+        except Exception as e:
+            logger.error("batch_extraction_failed", articles=len(group), error=str(e))
+            return []
 
-    def _get_entity_type(self, name: str, entities: List[Entity]) -> str:
-        """Look up entity type from extracted entities."""
-        for entity in entities:
-            if entity.name.lower() == name.lower():
-                return entity.entity_type
-        return "unknown"
+        for article, result in zip(group, results):
+            result.source_url = article.get("url", "")
+        return results
 
-    async def extract_batch(
+    def _start_groups(
         self,
         articles: List[dict],
-        max_concurrent: int = 5
-    ) -> List[ExtractionResult]:
-        """Extract from multiple articles with concurrency control."""
+        max_concurrent: int,
+        articles_per_call: int
+    ) -> List[asyncio.Task]:
+        """Start one task per group of articles, sharing a semaphore."""
+        if articles_per_call < 1:
+            raise ValueError(f"articles_per_call must be at least 1, got {articles_per_call}")
+        # Keep each article's full llm_max_tokens budget within the model's output cap
+        max_per_call = max(settings.llm_max_output_tokens // settings.llm_max_tokens, 1)
+        if articles_per_call > max_per_call:
+            logger.warning("articles_per_call_reduced", requested=articles_per_call, used=max_per_call)
+            articles_per_call = max_per_call
+
         semaphore = asyncio.Semaphore(max_concurrent)
+        return [
+            asyncio.ensure_future(self._extract_group(articles[i:i + articles_per_call], semaphore))
+            for i in range(0, len(articles), articles_per_call)
+        ]
 
-        async def extract_one(article):
-            async with semaphore:
-                result = await self.extract(
-                    article.get("title", ""),
-                    article.get("content", "") or article.get("summary", "")
-                )
-                result.source_url = article.get("url", "")
-                return result
-
-        results = await asyncio.gather(
-            *[extract_one(a) for a in articles],
-            return_exceptions=True
-        )
+    async def iter_extract(
+        self,
+        articles: List[dict],
+        max_concurrent: int = 5,
+        articles_per_call: int = 1
+    ) -> AsyncIterator[ExtractionResult]:
+        """Yield extraction results as each article (or group) finishes.
+
+        Results come in completion order, not article order; source_url
+        identifies the article. Lets callers store results while the rest
+        of the batch is still being extracted.
+        """
+        tasks = self._start_groups(articles, max_concurrent, articles_per_call)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            # The caller stopped early; don't leave extractions running
+            for task in tasks:
+                task.cancel()
 
-        # Filter out exceptions
-        return [r for r in results if isinstance(r, ExtractionResult)]
+    async def extract_batch(
+        self,
+        articles: List[dict],
+        max_concurrent: int = 5,
+        articles_per_call: int = 1
+    ) -> List[ExtractionResult]:
+        """Extract from multiple articles with concurrency control.
+
+        With articles_per_call > 1, articles are sent in groups of that
+        size through extract_multi(), one LLM call per group. Groups are
+        capped so llm_max_tokens per article fits in llm_max_output_tokens.
+        Results are in article order, less any whose extraction raised.
+        """
+        groups = await asyncio.gather(
+            *self._start_groups(articles, max_concurrent, articles_per_call)
+        )
+        return [result for group in groups for result in group]
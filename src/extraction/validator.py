@@ -25,6 +25,12 @@ INVALID_PATTERNS = [
     r'^[^a-zA-Z]*$',  # No letters at all
 ]
 
+# Compiled once at import: lowercased names, and the patterns as one
+# alternation so a name is matched in a single call
+_INVALID_ENTITIES_LOWER = frozenset(n.lower() for n in INVALID_ENTITIES)
+_INVALID_RE = re.compile("|".join(f"(?:{p})" for p in INVALID_PATTERNS))
+_HAS_LETTER_RE = re.compile(r'[a-zA-Z]')
+
 
 def is_valid_entity_name(name: str) -> bool:
     """Check if entity name is valid."""
@@ -36,16 +42,15 @@ def is_valid_entity_name(name: str) -> bool:
     name_lower = name.lower()
 
     # Check against invalid names
-    if name_lower in {n.lower() for n in INVALID_ENTITIES}:
+    if name_lower in _INVALID_ENTITIES_LOWER:
         return False
 
-    # Check against invalid patterns
-    for pattern in INVALID_PATTERNS:
-        if re.match(pattern, name):
-            return False
+    # Check against invalid patterns (anchored at the start, like re.match)
+    if _INVALID_RE.match(name):
+        return False
 
     # Must have at least one letter
-    if not re.search(r'[a-zA-Z]', name):
+    if not _HAS_LETTER_RE.search(name):
         return False
 
     # Reject if too short (single character or very short non-acronyms)
@@ -3,7 +3,7 @@
 import sqlite3
 import json
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -91,6 +91,22 @@ class KnowledgeGraph(KnowledgeGraphInterface):
     CREATE INDEX IF NOT EXISTS idx_kg_tags_tag ON kg_tags(tag);
     """
 
+    # Relationship columns with both endpoints, as read by _row_to_relationship
+    RELATIONSHIP_COLUMNS = """
+            r.id, r.predicate, r.event_date, r.confidence, r.context, r.source_url, r.metadata_json,
+            s.id as s_id, s.name as s_name, s.normalized_name as s_norm,
+            s.entity_type as s_type, s.attributes_json as s_attrs,
+            s.mention_count as s_count, s.first_seen as s_first, s.last_seen as s_last,
+            o.id as o_id, o.name as o_name, o.normalized_name as o_norm,
+            o.entity_type as o_type, o.attributes_json as o_attrs,
+            o.mention_count as o_count, o.first_seen as o_first, o.last_seen as o_last
+    """
+    RELATIONSHIP_JOINS = """
+        FROM kg_relationships r
+        JOIN kg_entities s ON r.subject_id = s.id
+        JOIN kg_entities o ON r.object_id = o.id
+    """
+
     def __init__(self, db_path: str = None):
         if db_path:
             self.db_path = db_path
@@ -230,24 +246,11 @@ class KnowledgeGraph(KnowledgeGraphInterface):
         predicate: str = None,
         obj: str = None,
         since_date: date = None,
-        limit: int = 100
+        limit: Optional[int] = 100
     ) -> List[GraphRelationship]:
-        """Query relationships with filters."""
+        """Query relationships with filters; limit=None returns every match."""
         with self._connection() as conn:
-            sql = """
-                SELECT
-                    r.id, r.predicate, r.event_date, r.confidence, r.context, r.source_url, r.metadata_json,
-                    s.id as s_id, s.name as s_name, s.normalized_name as s_norm,
-                    s.entity_type as s_type, s.attributes_json as s_attrs,
-                    s.mention_count as s_count, s.first_seen as s_first, s.last_seen as s_last,
-                    o.id as o_id, o.name as o_name, o.normalized_name as o_norm,
-                    o.entity_type as o_type, o.attributes_json as o_attrs,
-                    o.mention_count as o_count, o.first_seen as o_first, o.last_seen as o_last
-                FROM kg_relationships r
-                JOIN kg_entities s ON r.subject_id = s.id
-                JOIN kg_entities o ON r.object_id = o.id
-                WHERE 1=1
-            """
+            sql = f"SELECT {self.RELATIONSHIP_COLUMNS} {self.RELATIONSHIP_JOINS} WHERE 1=1"
             params = []
 
             if subject:
@@ -264,12 +267,52 @@ class KnowledgeGraph(KnowledgeGraphInterface):
                 sql += " AND (r.event_date IS NULL OR r.event_date >= ?)"
                 params.append(since_date.isoformat())
 
-            sql += " ORDER BY r.event_date DESC, r.id DESC LIMIT ?"
-            params.append(limit)
+            sql += " ORDER BY r.event_date DESC, r.id DESC"
+            if limit is not None:
+                sql += " LIMIT ?"
+                params.append(limit)
 
             cursor = conn.execute(sql, params)
             return [self._row_to_relationship(row) for row in cursor.fetchall()]
 
+    def query_many(
+        self,
+        predicates: List[str],
+        subject: str = None,
+        obj: str = None,
+        limit: int = 100
+    ) -> Dict[str, List[GraphRelationship]]:
+        """Query several predicates in one pass, up to limit relationships each.
+
+        Returns the same lists as calling query() once per predicate.
+        """
+        with self._connection() as conn:
+            # Rank within each predicate so the limit applies per predicate
+            sql = f"""
+                SELECT {self.RELATIONSHIP_COLUMNS},
+                    ROW_NUMBER() OVER (
+                        PARTITION BY r.predicate ORDER BY r.event_date DESC, r.id DESC
+                    ) AS rn
+                {self.RELATIONSHIP_JOINS}
+                WHERE r.predicate IN ({', '.join('?' * len(predicates))})
+            """
+            params = list(predicates)
+
+            if subject:
+                sql += " AND s.normalized_name LIKE ?"
+                params.append(f"%{subject.lower()}%")
+            if obj:
+                sql += " AND o.normalized_name LIKE ?"
+                params.append(f"%{obj.lower()}%")
+
+            sql = f"SELECT * FROM ({sql}) WHERE rn <= ? ORDER BY rn"
+            params.append(limit)
+
+            results = {predicate: [] for predicate in predicates}
+            for row in conn.execute(sql, params):
+                results[row["predicate"]].append(self._row_to_relationship(row))
+            return results
+
     def who_hired(self, company: str, since: date = None) -> List[GraphRelationship]:
         """Find people hired by a company."""
         return self.query(obj=company, predicate="HIRED_BY", since_date=since)
@@ -451,6 +494,18 @@ class KnowledgeGraph(KnowledgeGraphInterface):
                     }
                 return result
 
+    def get_unenriched_companies(self, limit: int = 50) -> List[GraphEntity]:
+        """Get companies with no enrichment data, most mentioned first."""
+        with self._connection() as conn:
+            cursor = conn.execute("""
+                SELECT * FROM kg_entities e
+                WHERE e.entity_type = 'company'
+                AND NOT EXISTS (SELECT 1 FROM kg_enrichment en WHERE en.entity_id = e.id)
+                ORDER BY e.mention_count DESC
+                LIMIT ?
+            """, (limit,))
+            return [self._row_to_entity(row) for row in cursor.fetchall()]
+
     def get_entity_by_id(self, entity_id: int) -> Optional[GraphEntity]:
         """Get an entity by ID."""
         with self._connection() as conn:
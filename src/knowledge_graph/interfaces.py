@@ -1,6 +1,7 @@
 """Interface definitions for knowledge graph operations."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional, Dict, Any
 from datetime import date
 
@@ -31,6 +32,12 @@ class GraphRelationship:
     source_url: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)  # Amounts, deal terms, etc.
 
+    @cached_property
+    def context_preview(self) -> str:
+        """Context truncated to 80 chars for table display."""
+        c = self.context or ''
+        return f"{c[:80]}{'...' if len(c) > 80 else ''}" or '-'
+
 
 class KnowledgeGraphInterface:
     """Interface for knowledge graph operations."""
@@ -69,9 +76,19 @@ class KnowledgeGraphInterface:
         predicate: str = None,
         obj: str = None,
         since_date: date = None,
-        limit: int = 100
+        limit: Optional[int] = 100
     ) -> List[GraphRelationship]:
-        """Query relationships with filters."""
+        """Query relationships with filters; limit=None returns every match."""
+        raise NotImplementedError
+
+    def query_many(
+        self,
+        predicates: List[str],
+        subject: str = None,
+        obj: str = None,
+        limit: int = 100
+    ) -> Dict[str, List[GraphRelationship]]:
+        """Query several predicates at once, up to limit relationships each."""
         raise NotImplementedError
 
     # High-level queries
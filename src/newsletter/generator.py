@@ -5,6 +5,7 @@ from typing import List, Optional
 from dataclasses import dataclass, field
 
 import structlog
+from markupsafe import escape
 
 from ..knowledge_graph.graph import KnowledgeGraph
 
@@ -235,6 +236,7 @@ class NewsletterGenerator:
             amount = self._extract_amount(context)
 
             items.append({
+                'kind': 'funding',
                 'company': company_name,
                 'investor': rel.object.name if hasattr(rel.object, 'name') else str(rel.object),
                 'amount': amount,
@@ -282,6 +284,7 @@ class NewsletterGenerator:
             seen.add(key)
 
             items.append({
+                'kind': 'acquisition',
                 'acquirer': acquirer,
                 'target': target,
                 'context': getattr(rel, 'context', ''),
@@ -319,6 +322,7 @@ class NewsletterGenerator:
             count = self._extract_layoff_count(context)
 
             items.append({
+                'kind': 'layoff',
                 'company': company,
                 'employees': count,
                 'context': context,
@@ -352,6 +356,7 @@ class NewsletterGenerator:
             seen.add(key)
 
             items.append({
+                'kind': 'move',
                 'person': person,
                 'action': 'left',
                 'company': company,
@@ -371,6 +376,7 @@ class NewsletterGenerator:
             seen.add(key)
 
             items.append({
+                'kind': 'move',
                 'person': person,
                 'action': 'joined',
                 'company': company,
@@ -411,6 +417,7 @@ class NewsletterGenerator:
                     break
 
             candidates.append({
+                'kind': 'candidate',
                 'name': person,
                 'title': title or 'Executive',
                 'previous_company': company,
@@ -594,20 +601,20 @@ class NewsletterGenerator:
 
                 if 'company' in item and 'amount' in item:
                     # Funding item
-                    html += f'<span class="company">{item["company"]}</span>'
+                    html += f'<span class="company">{escape(item["company"])}</span>'
                     if item.get('amount'):
-                        html += f' <span class="detail">raised</span> <span class="amount">{item["amount"]}</span>'
+                        html += f' <span class="detail">raised</span> <span class="amount">{escape(item["amount"])}</span>'
                     tag_class = "tag-sec" if item.get('source') == 'SEC' else "tag-news"
-                    html += f'</div><span class="tag {tag_class}">{item.get("source", "News")}</span>'
+                    html += f'</div><span class="tag {tag_class}">{escape(item.get("source", "News"))}</span>'
 
                 elif 'acquirer' in item:
                     # Acquisition item
-                    html += f'<span class="company">{item["acquirer"]}</span> <span class="detail">acquired</span> <span class="company">{item["target"]}</span>'
+                    html += f'<span class="company">{escape(item["acquirer"])}</span> <span class="detail">acquired</span> <span class="company">{escape(item["target"])}</span>'
                     html += '</div><span class="tag tag-ma">M&A</span>'
 
                 elif 'employees' in item:
                     # Layoff item
-                    html += f'<span class="company">{item["company"]}</span>'
+                    html += f'<span class="company">{escape(item["company"])}</span>'
                     if item.get('employees'):
                         html += f' <span class="detail">{item["employees"]:,} employees</span>'
                     html += '</div><span class="tag tag-layoff">Layoff</span>'
@@ -615,16 +622,16 @@ class NewsletterGenerator:
                 elif 'person' in item and 'action' in item:
                     # Executive move
                     action_word = "joined" if item["action"] == "joined" else "left"
-                    html += f'<span class="company">{item["person"]}</span> <span class="detail">{action_word}</span> <span class="company">{item["company"]}</span>'
+                    html += f'<span class="company">{escape(item["person"])}</span> <span class="detail">{action_word}</span> <span class="company">{escape(item["company"])}</span>'
                     tag_class = "tag-hired" if item.get("signal") == "Hired" else "tag-available"
-                    html += f'</div><span class="tag {tag_class}">{item.get("signal", "Move")}</span>'
+                    html += f'</div><span class="tag {tag_class}">{escape(item.get("signal", "Move"))}</span>'
 
                 elif 'name' in item and 'previous_company' in item:
                     # Candidate
-                    html += f'<span class="company">{item["name"]}</span>'
+                    html += f'<span class="company">{escape(item["name"])}</span>'
                     if item.get('title'):
-                        html += f' <span class="detail">({item["title"]})</span>'
-                    html += f' <span class="detail">from {item["previous_company"]}</span>'
+                        html += f' <span class="detail">({escape(item["title"])})</span>'
+                    html += f' <span class="detail">from {escape(item["previous_company"])}</span>'
                     html += '</div><span class="tag tag-available">Available</span>'
 
                 else:
@@ -1,7 +1,7 @@
 """Database operations for article storage."""
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pathlib import Path
 
 from sqlalchemy import create_engine
@@ -271,11 +271,15 @@ class ArticleStorage(StorageInterface):
 
     def get_all_feed_stats(self) -> List[dict]:
         """Get statistics for all feeds."""
+        return list(self.get_feed_stats_map().values())
+
+    def get_feed_stats_map(self) -> Dict[str, dict]:
+        """Get statistics for all feeds, keyed by feed name."""
         session = self.Session()
         try:
             all_stats = session.query(FeedStatsModel).all()
-            return [
-                {
+            return {
+                s.feed_name: {
                     "feed_name": s.feed_name,
                     "last_fetch_at": s.last_fetch_at,
                     "total_articles": s.total_articles or 0,
@@ -287,6 +291,6 @@ class ArticleStorage(StorageInterface):
                     "fetch_count": s.fetch_count or 0,
                 }
                 for s in all_stats
-            ]
+            }
         finally:
             session.close()
@@ -301,8 +301,32 @@ class PostgresArticleStorage:
                         last_fetch_at = %s
                 """, (feed_name, f"feed://{feed_name}", articles, datetime.utcnow(), error, articles, datetime.utcnow()))
 
+    def get_feed_stats(self, feed_name: str) -> Optional[dict]:
+        """Get statistics for a specific feed."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT name, last_fetch_at, total_articles, last_error, consecutive_failures
+                FROM feeds
+                WHERE name = %s
+            """, (feed_name,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return {
+                "feed_name": row[0],
+                "last_fetch_at": row[1],
+                "total_articles": row[2] or 0,
+                "last_error": row[3],
+                "consecutive_failures": row[4] or 0,
+            }
+
     def get_all_feed_stats(self) -> list:
         """Get statistics for all feeds."""
+        return list(self.get_feed_stats_map().values())
+
+    def get_feed_stats_map(self) -> dict:
+        """Get statistics for all feeds, keyed by feed name."""
         with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -310,8 +334,8 @@ class PostgresArticleStorage:
                 FROM feeds
                 ORDER BY name
             """)
-            return [
-                {
+            return {
+                row[0]: {
                     "feed_name": row[0],
                     "last_fetch_at": row[1],
                     "total_articles": row[2] or 0,
@@ -319,7 +343,7 @@ class PostgresArticleStorage:
                     "consecutive_failures": row[4] or 0,
                 }
                 for row in cursor.fetchall()
-            ]
+            }
 
 
 class PostgresKnowledgeGraph:
@@ -327,6 +351,21 @@ class PostgresKnowledgeGraph:
 
     def __init__(self, database_url: str):
         self.database_url = database_url
+        self._migrate_schema()
+
+    def _migrate_schema(self):
+        """Add columns that databases created from an older schema.sql lack."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            # Check first: ALTER TABLE locks the table even when it's a no-op
+            cursor.execute("""
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'entities' AND column_name = 'enrichment_source'
+            """)
+            if not cursor.fetchone():
+                cursor.execute(
+                    "ALTER TABLE entities ADD COLUMN IF NOT EXISTS enrichment_source VARCHAR(50)"
+                )
 
     @contextmanager
     def _connection(self):
@@ -467,36 +506,35 @@ class PostgresKnowledgeGraph:
                 logger.debug("relationship_exists", subject=subject_name, predicate=predicate, object=object_name)
                 return None
 
+    # Relationship columns with both endpoints, as read by _row_to_relationship
+    RELATIONSHIP_COLUMNS = """
+            r.id, r.predicate, r.start_date, r.confidence, r.context, r.source_url,
+            s.id as s_id, s.name as s_name, s.normalized_name as s_norm,
+            s.entity_type as s_type, s.attributes as s_attrs,
+            s.mention_count as s_count, s.first_seen_at as s_first, s.last_seen_at as s_last,
+            o.id as o_id, o.name as o_name, o.normalized_name as o_norm,
+            o.entity_type as o_type, o.attributes as o_attrs,
+            o.mention_count as o_count, o.first_seen_at as o_first, o.last_seen_at as o_last
+    """
+    RELATIONSHIP_JOINS = """
+        FROM relationships r
+        JOIN entities s ON r.subject_id = s.id
+        JOIN entities o ON r.object_id = o.id
+    """
+
     def query(
         self,
         subject: str = None,
         predicate: str = None,
         obj: str = None,
         since_date=None,
-        limit: int = 100
+        limit: Optional[int] = 100
     ):
-        """Query relationships with filters."""
-        from ..knowledge_graph.interfaces import GraphEntity, GraphRelationship
-        import json
-        from datetime import date
-
+        """Query relationships with filters; limit=None returns every match."""
         with self._connection() as conn:
             cursor = conn.cursor()
 
-            sql = """
-                SELECT
-                    r.id, r.predicate, r.start_date, r.confidence, r.context, r.source_url,
-                    s.id as s_id, s.name as s_name, s.normalized_name as s_norm,
-                    s.entity_type as s_type, s.attributes as s_attrs,
-                    s.mention_count as s_count, s.first_seen_at as s_first, s.last_seen_at as s_last,
-                    o.id as o_id, o.name as o_name, o.normalized_name as o_norm,
-                    o.entity_type as o_type, o.attributes as o_attrs,
-                    o.mention_count as o_count, o.first_seen_at as o_first, o.last_seen_at as o_last
-                FROM relationships r
-                JOIN entities s ON r.subject_id = s.id
-                JOIN entities o ON r.object_id = o.id
-                WHERE 1=1
-            """
+            sql = f"SELECT {self.RELATIONSHIP_COLUMNS} {self.RELATIONSHIP_JOINS} WHERE 1=1"
             params = []
 
             if subject:
@@ -512,46 +550,91 @@ class PostgresKnowledgeGraph:
                 sql += " AND (r.start_date IS NULL OR r.start_date >= %s)"
                 params.append(since_date.isoformat())
 
-            sql += " ORDER BY r.start_date DESC NULLS LAST, r.id DESC LIMIT %s"
-            params.append(limit)
+            sql += " ORDER BY r.start_date DESC NULLS LAST, r.id DESC"
+            if limit is not None:
+                sql += " LIMIT %s"
+                params.append(limit)
 
             cursor.execute(sql, params)
+            return [self._row_to_relationship(row) for row in cursor.fetchall()]
 
-            results = []
+    def query_many(
+        self,
+        predicates: List[str],
+        subject: str = None,
+        obj: str = None,
+        limit: int = 100
+    ) -> dict:
+        """Query several predicates in one pass, up to limit relationships each.
+
+        Returns the same lists as calling query() once per predicate.
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            # Rank within each predicate so the limit applies per predicate
+            sql = f"""
+                SELECT {self.RELATIONSHIP_COLUMNS},
+                    ROW_NUMBER() OVER (
+                        PARTITION BY r.predicate ORDER BY r.start_date DESC NULLS LAST, r.id DESC
+                    ) AS rn
+                {self.RELATIONSHIP_JOINS}
+                WHERE r.predicate = ANY(%s)
+            """
+            params = [list(predicates)]
+
+            if subject:
+                sql += " AND s.normalized_name LIKE %s"
+                params.append(f"%{subject.lower()}%")
+            if obj:
+                sql += " AND o.normalized_name LIKE %s"
+                params.append(f"%{obj.lower()}%")
+
+            sql = f"SELECT * FROM ({sql}) ranked WHERE rn <= %s ORDER BY rn"
+            params.append(limit)
+
+            cursor.execute(sql, params)
+            results = {predicate: [] for predicate in predicates}
             for row in cursor.fetchall():
-                subject_entity = GraphEntity(
-                    id=str(row[6]),
-                    name=row[7],
-                    normalized_name=row[8],
-                    entity_type=row[9],
-                    attributes=row[10] if isinstance(row[10], dict) else {},
-                    mention_count=row[11] or 0,
-                    first_seen=row[12].date() if row[12] else None,
-                    last_seen=row[13].date() if row[13] else None,
-                )
-                object_entity = GraphEntity(
-                    id=str(row[14]),
-                    name=row[15],
-                    normalized_name=row[16],
-                    entity_type=row[17],
-                    attributes=row[18] if isinstance(row[18], dict) else {},
-                    mention_count=row[19] or 0,
-                    first_seen=row[20].date() if row[20] else None,
-                    last_seen=row[21].date() if row[21] else None,
-                )
-                results.append(GraphRelationship(
-                    id=str(row[0]),
-                    subject=subject_entity,
-                    predicate=row[1],
-                    object=object_entity,
-                    event_date=row[2] if row[2] else None,
-                    confidence=row[3] or 0.0,
-                    context=row[4] or "",
-                    source_url=row[5] or "",
-                    metadata={},
-                ))
+                results[row[1]].append(self._row_to_relationship(row))
             return results
 
+    def _row_to_relationship(self, row):
+        """Convert a RELATIONSHIP_COLUMNS row to GraphRelationship."""
+        from ..knowledge_graph.interfaces import GraphEntity, GraphRelationship
+
+        subject_entity = GraphEntity(
+            id=str(row[6]),
+            name=row[7],
+            normalized_name=row[8],
+            entity_type=row[9],
+            attributes=row[10] if isinstance(row[10], dict) else {},
+            mention_count=row[11] or 0,
+            first_seen=row[12].date() if row[12] else None,
+            last_seen=row[13].date() if row[13] else None,
+        )
+        object_entity = GraphEntity(
+            id=str(row[14]),
+            name=row[15],
+            normalized_name=row[16],
+            entity_type=row[17],
+            attributes=row[18] if isinstance(row[18], dict) else {},
+            mention_count=row[19] or 0,
+            first_seen=row[20].date() if row[20] else None,
+            last_seen=row[21].date() if row[21] else None,
+        )
+        return GraphRelationship(
+            id=str(row[0]),
+            subject=subject_entity,
+            predicate=row[1],
+            object=object_entity,
+            event_date=row[2] if row[2] else None,
+            confidence=row[3] or 0.0,
+            context=row[4] or "",
+            source_url=row[5] or "",
+            metadata={},
+        )
+
     def who_hired(self, company: str, since=None):
         """Find people hired by a company."""
         return self.query(obj=company, predicate="HIRED_BY", since_date=since)
@@ -633,7 +716,7 @@ class PostgresKnowledgeGraph:
 
     # Enrichment methods
     def add_enrichment(self, entity_id: str, source: str, data: dict) -> bool:
-        """Add enrichment data for an entity."""
+        """Add enrichment data for an entity, replacing any earlier source's."""
         import json
         with self._connection() as conn:
             cursor = conn.cursor()
@@ -641,32 +724,52 @@ class PostgresKnowledgeGraph:
                 cursor.execute("""
                     UPDATE entities
                     SET enrichment_data = %s::jsonb,
+                        enrichment_source = %s,
                         enrichment_status = 'enriched',
                         enriched_at = NOW()
                     WHERE id = %s
-                """, (json.dumps(data), entity_id))
+                """, (json.dumps(data), source, entity_id))
                 return True
             except Exception as e:
                 logger.error("enrichment_failed", error=str(e))
                 return False
 
     def get_enrichment(self, entity_id: str, source: str = None) -> dict:
-        """Get enrichment data for an entity."""
+        """Get enrichment data for an entity, only if it came from source when given."""
         with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT enrichment_data, enriched_at
+            sql = """
+                SELECT enrichment_data, enriched_at, enrichment_source
                 FROM entities
                 WHERE id = %s
-            """, (entity_id,))
+            """
+            params = [entity_id]
+            if source:
+                sql += " AND enrichment_source = %s"
+                params.append(source)
+            cursor.execute(sql, params)
             row = cursor.fetchone()
             if row and row[0]:
                 return {
+                    "source": row[2],
                     "data": row[0] if isinstance(row[0], dict) else {},
                     "enriched_at": row[1]
                 }
             return {}
 
+    def get_unenriched_companies(self, limit: int = 50):
+        """Get companies with no enrichment data, most mentioned first."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM entities
+                WHERE entity_type = 'company'
+                AND enrichment_status IS DISTINCT FROM 'enriched'
+                ORDER BY mention_count DESC
+                LIMIT %s
+            """, (limit,))
+            return [self._row_to_entity(cursor, row) for row in cursor.fetchall()]
+
     def get_entity_by_id(self, entity_id: str):
         """Get an entity by ID."""
         with self._connection() as conn:
@@ -103,6 +103,81 @@ class TestKeywordClassifier:
         assert results[1].primary_type == EventType.FUNDING
         assert results[2].primary_type == EventType.OTHER
 
+    def test_repeated_articles_use_cache(self):
+        """Classifying the same article twice should hit the result cache."""
+        classifier = KeywordClassifier()
+
+        first = classifier.classify("Startup raises $50M", "Funding round...")
+        second = classifier.classify("Startup raises $50M", "Funding round...")
+
+        assert second is first
+        assert len(classifier._cache) == 1
+
+    def test_result_cache_is_bounded(self):
+        """The cache should keep at most CACHE_SIZE results, dropping the oldest."""
+        classifier = KeywordClassifier()
+        classifier.CACHE_SIZE = 2
+
+        first = classifier.classify("Startup raises $50M", "")
+        classifier.classify("Acme acquires Beta", "")
+        classifier.classify("Gamma lays off staff", "")
+
+        assert len(classifier._cache) == 2
+        assert classifier.classify("Startup raises $50M", "") is not first
+
+    def test_keyword_word_boundaries(self):
+        """Anchored keywords should not match inside longer words."""
+        classifier = KeywordClassifier()
+
+        result = classifier.classify(
+            title="Acquirer mergers roundup",
+            content="Nothing was acquired... by the acquirers."
+        )
+
+        assert result.primary_type == EventType.ACQUISITION
+        assert sorted(result.matched_keywords) == ["acquired"]
+
+    def test_automaton_matches_regex_scan(self):
+        """Automaton keyword scan should score exactly like the regex scan."""
+        classifier = KeywordClassifier()
+        if classifier.automaton is None:
+            pytest.skip("pyahocorasick not installed")
+
+        title = "Startup raises $20M Series B, lays off staff"
+        content = (
+            "The company secures funding from investors after a merger. "
+            "CEO steps down; layoffs and restructuring follow the IPO plan."
+        )
+        text = f"{title} {title} {content}"
+
+        def scan(use_automaton):
+            scores = [0] * len(classifier.PATTERNS)
+            matched = set()
+            if use_automaton:
+                lowered = classifier._scan_keywords(text, scores, matched)
+                classifier._scan_residual(text, lowered, scores, matched)
+            else:
+                classifier._scan_regex(text, scores, matched)
+            return scores, matched
+
+        assert scan(True) == scan(False)
+
+    @pytest.mark.parametrize("title, content, primary, confidence, high_signal", [
+        # Greedy patterns match once across the repeated title
+        ("Acme raises $10M", "", EventType.FUNDING, 0.4, False),
+        ("Startup raised $5M seed", "", EventType.FUNDING, 0.4, False),
+        ("Jane Doe joins Acme as CTO", "", EventType.EXECUTIVE_MOVE, 0.8, True),
+        # Keywords can span the title/content join
+        ("Series A seed", "round of funding", EventType.FUNDING, 1.0, True),
+    ])
+    def test_scores_match_original_classifier(self, title, content, primary, confidence, high_signal):
+        """Scores should match the original title+title+content regex scan."""
+        result = KeywordClassifier().classify(title, content)
+
+        assert result.primary_type == primary
+        assert result.confidence == pytest.approx(confidence)
+        assert result.is_high_signal == high_signal
+
 
 class TestQualityEvaluator:
     """Tests for QualityEvaluator."""
@@ -151,3 +226,10 @@ class TestQualityEvaluator:
             content=""
         )
         assert result.has_person_names is True
+
+    def test_person_detection_whole_words(self):
+        """Person indicators should not match inside other words."""
+        evaluator = QualityEvaluator()
+
+        assert not evaluator.evaluate("Strategic partnership announced", "").has_person_names
+        assert evaluator.evaluate("Co-founders launch startup", "").has_person_names
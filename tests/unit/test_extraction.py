@@ -9,7 +9,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from src.extraction.interfaces import Entity, Relationship, ExtractionResult
+from src.extraction.llm_client import LLMClient, _is_transient
 from src.extraction.llm_extractor import LLMExtractor
+from src.config.settings import settings
 
 
 class TestLLMExtractor:
@@ -83,6 +85,8 @@ class TestLLMExtractor:
         assert result.relationships[0].predicate == "ACQUIRED"
         assert result.relationships[0].subject == "Workday"
         assert result.relationships[0].object == "HiredScore"
+        assert result.relationships[0].subject_type == "company"
+        assert result.relationships[0].object_type == "company"
 
     @pytest.mark.asyncio
     async def test_funding_extraction(self, mock_llm_response_funding):
@@ -137,6 +141,176 @@ class TestLLMExtractor:
         results = await extractor.extract_batch(articles)
         assert len(results) == 2
 
+    @pytest.mark.asyncio
+    async def test_batch_extraction_multi_article(self, mock_llm_response_acquisition):
+        """Should extract a group of articles with one LLM call."""
+        mock_client = MagicMock()
+        mock_client.complete = AsyncMock(
+            return_value=f"[{mock_llm_response_acquisition}, {mock_llm_response_acquisition}]"
+        )
+
+        extractor = LLMExtractor(llm_client=mock_client)
+
+        articles = [
+            {"title": "Article 1", "content": "Content 1", "url": "https://a.example/1"},
+            {"title": "Article 2", "content": "Content 2", "url": "https://a.example/2"},
+        ]
+
+        results = await extractor.extract_batch(articles, articles_per_call=2)
+        assert mock_client.complete.await_count == 1
+        assert [r.source_url for r in results] == ["https://a.example/1", "https://a.example/2"]
+        assert all(r.relationships[0].predicate == "ACQUIRED" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_multi_article_falls_back_on_wrong_count(self, mock_llm_response_acquisition):
+        """Should extract each article separately if the response has the wrong count."""
+        mock_client = MagicMock()
+        mock_client.complete = AsyncMock(side_effect=[
+            f"[{mock_llm_response_acquisition}]",
+            mock_llm_response_acquisition,
+            mock_llm_response_acquisition,
+        ])
+
+        extractor = LLMExtractor(llm_client=mock_client)
+
+        articles = [
+            {"title": "Article 1", "content": "Content 1"},
+            {"title": "Article 2", "content": "Content 2"},
+        ]
+
+        results = await extractor.extract_multi(articles)
+        assert mock_client.complete.await_count == 3
+        assert all(r.relationships[0].predicate == "ACQUIRED" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_multi_article_falls_back_when_call_raises(self, mock_llm_response_acquisition):
+        """Should extract each article separately if the group call fails."""
+        mock_client = MagicMock()
+        mock_client.complete = AsyncMock(side_effect=[
+            RuntimeError("400 max_output_tokens too large"),
+            mock_llm_response_acquisition,
+            mock_llm_response_acquisition,
+        ])
+
+        extractor = LLMExtractor(llm_client=mock_client)
+
+        articles = [
+            {"title": "Article 1", "content": "Content 1"},
+            {"title": "Article 2", "content": "Content 2"},
+        ]
+
+        results = await extractor.extract_multi(articles)
+        assert mock_client.complete.await_count == 3
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_extraction_caps_articles_per_call(self, mock_llm_response_acquisition):
+        """Should size groups so max_tokens stays within the model's output limit."""
+        def respond(prompt, **kwargs):
+            count = prompt.count(" CONTENT:\n")
+            if "ARTICLE 1 TITLE" not in prompt:
+                return mock_llm_response_acquisition
+            return "[" + ", ".join([mock_llm_response_acquisition] * count) + "]"
+
+        mock_client = MagicMock()
+        mock_client.complete = AsyncMock(side_effect=respond)
+
+        extractor = LLMExtractor(llm_client=mock_client)
+
+        articles = [{"title": f"Article {i}", "content": f"Content {i}"} for i in range(5)]
+
+        with patch.object(settings, "llm_max_tokens", 2000), \
+                patch.object(settings, "llm_max_output_tokens", 8192):
+            results = await extractor.extract_batch(articles, articles_per_call=5)
+            with pytest.raises(ValueError):
+                await extractor.extract_batch(articles, articles_per_call=0)
+
+        assert len(results) == 5
+        assert mock_client.complete.await_count == 2  # Groups of 4 and 1
+        assert all(
+            call.kwargs.get("max_tokens", 0) <= 8192
+            for call in mock_client.complete.await_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_iter_extract_yields_every_article(self, mock_llm_response_acquisition):
+        """Should stream one result per article as extractions finish."""
+        mock_client = MagicMock()
+        mock_client.complete = AsyncMock(return_value=mock_llm_response_acquisition)
+
+        extractor = LLMExtractor(llm_client=mock_client)
+
+        articles = [
+            {"title": f"Article {i}", "content": f"Content {i}", "url": f"https://a.example/{i}"}
+            for i in range(4)
+        ]
+
+        urls = [r.source_url async for r in extractor.iter_extract(articles, max_concurrent=2)]
+        assert sorted(urls) == [a["url"] for a in articles]
+
+    def test_validate_entity_rejects_bad_patterns(self):
+        """Should reject names containing any bad pattern, anywhere in the name."""
+        extractor = LLMExtractor(llm_client=MagicMock())
+
+        for pattern in LLMExtractor.BAD_ENTITY_PATTERNS:
+            assert not extractor._validate_entity(f"Acme {pattern} Labs", "company")
+
+        assert extractor._validate_entity("Workday", "company")
+        assert extractor._validate_entity("Athena Karp", "person")
+        assert not extractor._validate_entity("Athena", "person")
+
+    def test_validate_entity_matches_bad_patterns_as_whole_words(self):
+        """Should not reject names that merely contain a bad pattern."""
+        extractor = LLMExtractor(llm_client=MagicMock())
+
+        assert extractor._validate_entity("Marissa Mayer", "person")
+        assert extractor._validate_entity("Marin Academy", "company")
+        assert extractor._validate_entity("Thatcher Capital", "investor")
+        assert not extractor._validate_entity("Reported earnings", "company")
+        assert not extractor._validate_entity("Acme, which", "company")
+
+    def test_normalize_entity_name_strips_one_company_suffix(self):
+        """Should drop a trailing company suffix, only for companies."""
+        extractor = LLMExtractor(llm_client=MagicMock())
+
+        assert extractor._normalize_entity_name(" Workday Inc. ", "company") == "Workday"
+        assert extractor._normalize_entity_name("Acme Corporation", "company") == "Acme"
+        assert extractor._normalize_entity_name("Acme Co Inc", "company") == "Acme Co"
+        assert extractor._normalize_entity_name("Acme inc", "company") == "Acme inc"
+        assert extractor._normalize_entity_name("Jane Co", "person") == "Jane Co"
+
+
+class TestLLMClient:
+    """Tests for LLMClient provider setup."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ["anthropic", "openai"])
+    async def test_sdk_clients_share_one_http_pool(self, provider):
+        """Should build each SDK's client with a shared pool the SDK accepts."""
+        first = LLMClient(provider=provider, api_key="test-key")._get_client()
+        second = LLMClient(provider=provider, api_key="test-key")._get_client()
+
+        assert first._client is second._client
+
+    def test_retries_only_transient_errors(self):
+        """Should retry network errors and retryable statuses, nothing deterministic."""
+        import anthropic
+        import httpx
+
+        request = httpx.Request("POST", "https://api.example/v1")
+        status_error = lambda code: type("StatusError", (Exception,), {"status_code": code})()
+
+        assert _is_transient(httpx.ConnectError("refused", request=request))
+        assert _is_transient(TimeoutError())
+        assert _is_transient(anthropic.APITimeoutError(request=request))
+        assert _is_transient(status_error(429))
+        assert _is_transient(status_error(503))
+
+        assert not _is_transient(status_error(400))
+        assert not _is_transient(ValueError("API key not configured"))
+        assert not _is_transient(TypeError("bad http_client"))
+        assert not _is_transient(IndexError("list index out of range"))
+        assert not _is_transient(KeyError("content"))
 
 class TestExtractionDataclasses:
     """Tests for extraction dataclasses."""
@@ -0,0 +1,125 @@
+"""Unit tests for the knowledge graph web viewer."""
+
+import pytest
+import tempfile
+import os
+
+# Add src and scripts to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import kg_viewer
+from src.knowledge_graph.graph import KnowledgeGraph
+
+PAYLOAD = '<script>alert("x")</script>'
+BAD_URL = 'https://example.com/"onmouseover="alert(1)'
+
+
+@pytest.fixture
+def temp_kg(monkeypatch):
+    """Provide a temporary knowledge graph served by the viewer."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    kg = KnowledgeGraph(db_path)
+    monkeypatch.setattr(kg_viewer, "get_kg", lambda: kg)
+    yield kg
+    try:
+        os.unlink(db_path)
+    except FileNotFoundError:
+        pass
+
+
+def assert_escaped(html: str):
+    """No injected markup or attribute breakout reaches the page."""
+    assert PAYLOAD not in html
+    assert 'alert("x")' not in html
+    assert '"onmouseover=' not in html
+
+
+class TestEntityDetail:
+    """Tests for the entity detail page."""
+
+    @pytest.mark.asyncio
+    async def test_escapes_company_values(self, temp_kg):
+        """Should escape entity, relationship and enrichment values."""
+        name = f'Evil "Co" {PAYLOAD}'
+        temp_kg.add_relationship(
+            name, "company", "FUNDED_BY", PAYLOAD, "company",
+            confidence=0.9, context=PAYLOAD, source_url=BAD_URL,
+        )
+        entity_id = temp_kg.get_entity(name).id
+        temp_kg.add_enrichment(entity_id, PAYLOAD, {
+            "description": PAYLOAD,
+            "employee_range": PAYLOAD,
+            "total_funding": PAYLOAD,
+            "investors": [PAYLOAD, "Sequoia"],
+            "website_url": BAD_URL,
+            "linkedin_url": BAD_URL,
+            "crunchbase_url": BAD_URL,
+        })
+
+        html = await kg_viewer.entity_detail(entity_id, subj_limit="50", obj_limit="50")
+
+        assert_escaped(html)
+        assert "&lt;script&gt;" in html
+        assert "keywords=Evil+%22Co%22+%3Cscript%3E" in html
+
+    @pytest.mark.asyncio
+    async def test_escapes_person_values(self, temp_kg):
+        """Should escape person enrichment values."""
+        entity_id = temp_kg.add_entity("Jane Doe", "person")
+        temp_kg.add_enrichment(entity_id, "web_search", {
+            "current_title": PAYLOAD,
+            "current_company": PAYLOAD,
+            "executive_level": PAYLOAD,
+            "skills": [PAYLOAD],
+            "linkedin_url": BAD_URL,
+        })
+
+        html = await kg_viewer.entity_detail(entity_id, subj_limit="50", obj_limit="50")
+
+        assert_escaped(html)
+        assert "&lt;script&gt;" in html
+
+    @pytest.mark.asyncio
+    async def test_escapes_raw_enrichment_data(self, temp_kg):
+        """Should escape keys and values in the fallback data table."""
+        entity_id = temp_kg.add_entity("Some Fund", "investor")
+        temp_kg.add_enrichment(entity_id, "web_search", {PAYLOAD: PAYLOAD})
+
+        html = await kg_viewer.entity_detail(entity_id, subj_limit="50", obj_limit="50")
+
+        assert_escaped(html)
+
+    @pytest.mark.asyncio
+    async def test_escapes_types_and_predicates(self, temp_kg):
+        """Should escape LLM-supplied entity types and predicates, in text and class names."""
+        temp_kg.add_relationship(
+            "Acme", PAYLOAD, PAYLOAD, "Beta", "company",
+            source_url="https://example.com/article",
+        )
+        entity_id = temp_kg.get_entity("Acme").id
+
+        html = await kg_viewer.entity_detail(entity_id, subj_limit="50", obj_limit="50")
+
+        assert_escaped(html)
+        assert "&lt;script&gt;" in html
+
+    @pytest.mark.asyncio
+    async def test_show_all_loads_every_relationship(self, temp_kg):
+        """Should not cap 'all' at the default query limit, nor claim a capped count is the total."""
+        for i in range(kg_viewer.ENTITY_QUERY_LIMIT + 20):
+            temp_kg.add_relationship("Hub Co", "company", "ACQUIRED", f"Target {i}", "company")
+        entity_id = temp_kg.get_entity("Hub Co").id
+        row = '<td><span class="tag tag-ACQUIRED">ACQUIRED</span></td>'
+
+        html = await kg_viewer.entity_detail(entity_id, subj_limit="50", obj_limit="50")
+        assert html.count(row) == kg_viewer.ENTITY_TABLE_ROWS
+        assert "(list truncated)" in html
+        assert f"Show all {kg_viewer.ENTITY_QUERY_LIMIT}<" not in html
+
+        html = await kg_viewer.entity_detail(entity_id, subj_limit="all", obj_limit="50")
+        assert html.count(row) == kg_viewer.ENTITY_QUERY_LIMIT + 20
+        assert "Show all" not in html
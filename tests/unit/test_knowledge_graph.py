@@ -119,6 +119,39 @@ class TestKnowledgeGraph:
         apple_acq = temp_kg.query(subject="apple", predicate="ACQUIRED")
         assert len(apple_acq) == 2
 
+    def test_query_without_limit(self, temp_kg):
+        """Should return every match when limit is None."""
+        for i in range(5):
+            temp_kg.add_relationship("Apple", "company", "ACQUIRED", f"Startup {i}", "company")
+
+        assert len(temp_kg.query(subject="apple", limit=2)) == 2
+        assert len(temp_kg.query(subject="apple", limit=None)) == 5
+
+    def test_query_many(self, temp_kg):
+        """Should match one query() per predicate, limited per predicate."""
+        temp_kg.add_relationship("Apple", "company", "ACQUIRED", "Beats", "company", event_date=date(2014, 5, 28))
+        temp_kg.add_relationship("Apple", "company", "ACQUIRED", "Shazam", "company", event_date=date(2018, 9, 24))
+        temp_kg.add_relationship("Apple", "company", "ACQUIRED", "Intel Modem", "company")
+        temp_kg.add_relationship("Apple", "company", "FUNDED_BY", "Sequoia", "company")
+        temp_kg.add_relationship("Google", "company", "ACQUIRED", "Fitbit", "company")
+
+        rels = temp_kg.query_many(["ACQUIRED", "FUNDED_BY", "HIRED_BY"], subject="apple", limit=2)
+
+        for predicate in ("ACQUIRED", "FUNDED_BY", "HIRED_BY"):
+            expected = temp_kg.query(subject="apple", predicate=predicate, limit=2)
+            assert [r.id for r in rels[predicate]] == [r.id for r in expected]
+        assert [r.object.name for r in rels["ACQUIRED"]] == ["Shazam", "Beats"]
+        assert rels["HIRED_BY"] == []
+
+    def test_context_preview(self, temp_kg):
+        """Should truncate long relationship context for display."""
+        temp_kg.add_relationship("Apple", "company", "ACQUIRED", "Beats", "company", context="x" * 100)
+        temp_kg.add_relationship("Google", "company", "ACQUIRED", "Fitbit", "company")
+
+        previews = {r.subject.name: r.context_preview for r in temp_kg.query(predicate="ACQUIRED")}
+        assert previews["Apple"] == "x" * 80 + "..."
+        assert previews["Google"] == "-"
+
     def test_who_hired(self, temp_kg):
         """Should find people hired by a company."""
         temp_kg.add_relationship("John Doe", "person", "HIRED_BY", "Google", "company")
@@ -136,6 +169,16 @@ class TestKnowledgeGraph:
         acqs = temp_kg.acquisitions()
         assert len(acqs) == 2
 
+    def test_get_unenriched_companies(self, temp_kg):
+        """Should return only companies without enrichment data."""
+        google_id = temp_kg.add_entity("Google", "company")
+        temp_kg.add_entity("Meta", "company")
+        temp_kg.add_entity("John Doe", "person")
+        temp_kg.add_enrichment(google_id, "web", {"industry": "Search"})
+
+        unenriched = temp_kg.get_unenriched_companies(limit=10)
+        assert [e.name for e in unenriched] == ["Meta"]
+
     def test_get_stats(self, temp_kg):
         """Should return graph statistics."""
         temp_kg.add_entity("Google", "company")